@@ -86,7 +86,14 @@ pub(crate) fn history_vec_derive(input: TokenStream) -> TokenStream {
 
             #push_doc
             pub fn push(&mut self, state: #original_name) {
-                #(self.#field_names.push(state.#field_names.clone());)*
+                // `state` is owned, so its fields are moved rather than cloned again
+                #(self.#field_names.push(state.#field_names);)*
+            }
+
+            /// Reserves capacity for at least `additional` more elements in every
+            /// history vec
+            pub fn reserve(&mut self, additional: usize) {
+                #(self.#field_names.reserve(additional);)*
             }
 
             /// clear all history vecs
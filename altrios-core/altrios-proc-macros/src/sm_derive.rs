@@ -72,6 +72,12 @@ pub(crate) fn state_methods_derive(input: TokenStream) -> TokenStream {
         quote! {}
     };
 
+    let self_reserve_history: TokenStream2 = if struct_has_state {
+        quote! {self.history.reserve(crate::traits::history_capacity(n_steps, interval));}
+    } else {
+        quote! {}
+    };
+
     if struct_is_state {
         impl_block.extend::<TokenStream2>(quote! {
             #[automatically_derived]
@@ -121,7 +127,8 @@ pub(crate) fn state_methods_derive(input: TokenStream) -> TokenStream {
             impl SaveState for #ident {
                 /// Implementation for structs with `save_interval`
                 fn save_state<F: Fn() -> String>(&mut self, loc: F) -> anyhow::Result<()> {
-                    if let Some(interval) = self.save_interval {
+                    // `Some(0)` is treated like `None` so that no history is saved
+                    if let Some(interval) = self.save_interval.filter(|interval| *interval > 0) {
                         if *self.state.i.get_fresh(|| format!("{}\n`{}.state.i` has not been updated", format_dbg!(), stringify!(#ident)))? % interval == (0 as usize)
                             || *self.state.i.get_fresh(|| format!("{}\n`{}.state.i` has not been updated", format_dbg!(), stringify!(#ident)))? == (1 as usize)
                         {
@@ -138,6 +145,14 @@ pub(crate) fn state_methods_derive(input: TokenStream) -> TokenStream {
                     }
                     Ok(())
                 }
+
+                #[allow(unused_variables)]
+                fn reserve_history(&mut self, n_steps: usize) {
+                    if let Some(interval) = self.save_interval.filter(|interval| *interval > 0) {
+                        #self_reserve_history
+                        #(self.#fields_with_state.reserve_history(n_steps);)*
+                    }
+                }
             }
         });
     } else {
@@ -157,6 +172,13 @@ pub(crate) fn state_methods_derive(input: TokenStream) -> TokenStream {
                     )?;)*
                     Ok(())
                 }
+
+                /// Own history is not reserved because how often it is saved depends on
+                /// the parent, but nested fields with `save_interval` are
+                #[allow(unused_variables)]
+                fn reserve_history(&mut self, n_steps: usize) {
+                    #(self.#fields_with_state.reserve_history(n_steps);)*
+                }
             }
         });
     }
@@ -44,6 +44,12 @@ impl SaveState for Vec<Locomotive> {
         }
         Ok(())
     }
+
+    fn reserve_history(&mut self, n_steps: usize) {
+        for loco in self.iter_mut() {
+            loco.reserve_history(n_steps);
+        }
+    }
 }
 
 impl Step for Vec<Locomotive> {
@@ -76,6 +82,25 @@ impl Consist {
         ))
     }
 
+    #[staticmethod]
+    #[pyo3(name = "from_locos_and_n_default")]
+    #[pyo3(signature = (loco_vec, n_default, save_interval=None))]
+    /// Builds a consist from `loco_vec` followed by `n_default` copies of
+    /// `Locomotive::default()`, which is constructed once and cloned in Rust
+    /// rather than marshaled from a Python list element by element.
+    fn from_locos_and_n_default_py(
+        mut loco_vec: Vec<Locomotive>,
+        n_default: usize,
+        save_interval: Option<usize>,
+    ) -> anyhow::Result<Self> {
+        loco_vec.resize(loco_vec.len() + n_default, Locomotive::default());
+        Ok(Self::new(
+            loco_vec,
+            save_interval,
+            PowerDistributionControlType::default(),
+        ))
+    }
+
     #[staticmethod]
     #[pyo3(name = "default")]
     fn default_py() -> Self {
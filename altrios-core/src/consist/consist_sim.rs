@@ -114,6 +114,7 @@ impl ConsistSimulation {
 
     /// Iterates step to solve all time steps.
     pub fn walk(&mut self) -> anyhow::Result<()> {
+        self.reserve_history(self.power_trace.len());
         self.save_state(|| format_dbg!())?;
         loop {
             if *self.loco_con.state.i.get_fresh(|| format_dbg!())? > self.power_trace.len() - 2 {
@@ -187,6 +188,10 @@ impl SaveState for ConsistSimulation {
         self.loco_con
             .save_state(|| format!("{}\n{}", loc(), format_dbg!()))
     }
+
+    fn reserve_history(&mut self, n_steps: usize) {
+        self.loco_con.reserve_history(n_steps);
+    }
 }
 
 impl Init for ConsistSimulation {
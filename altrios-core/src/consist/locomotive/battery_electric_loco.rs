@@ -258,6 +258,12 @@ impl SaveState for BatteryPowertrainControls {
         }
         Ok(())
     }
+
+    fn reserve_history(&mut self, n_steps: usize) {
+        match self {
+            Self::RGWDB(rgwdb) => rgwdb.reserve_history(n_steps),
+        }
+    }
 }
 
 impl CheckAndResetState for BatteryPowertrainControls {
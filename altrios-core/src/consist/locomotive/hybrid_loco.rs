@@ -325,6 +325,12 @@ impl SaveState for HybridPowertrainControls {
         }
         Ok(())
     }
+
+    fn reserve_history(&mut self, n_steps: usize) {
+        match self {
+            Self::RGWDB(rgwdb) => rgwdb.reserve_history(n_steps),
+        }
+    }
 }
 
 impl Step for HybridPowertrainControls {
@@ -172,6 +172,13 @@ impl LocomotiveSimulation {
         Self::new(loco_unit, power_trace, save_interval)
     }
 
+    #[getter]
+    /// Simulated locomotive, so that Python callers can reach its histories without
+    /// serializing the whole simulation via `to_pydict`
+    fn get_loco_unit(&self) -> Locomotive {
+        self.loco_unit.clone()
+    }
+
     #[pyo3(name = "walk")]
     /// Exposes `walk` to Python.
     fn walk_py(&mut self) -> anyhow::Result<()> {
@@ -284,6 +291,7 @@ impl LocomotiveSimulation {
 
     /// Iterates `save_state` and `step` through all time steps.
     pub fn walk(&mut self) -> anyhow::Result<()> {
+        self.reserve_history(self.power_trace.len());
         self.save_state(|| format_dbg!())?;
         loop {
             if *self.loco_unit.state.i.get_fresh(|| format_dbg!())? > self.power_trace.len() - 2 {
@@ -339,6 +347,10 @@ impl SaveState for LocomotiveSimulation {
             .save_state(|| format!("{}\n{}", loc(), format_dbg!()))?;
         Ok(())
     }
+
+    fn reserve_history(&mut self, n_steps: usize) {
+        self.loco_unit.reserve_history(n_steps);
+    }
 }
 
 impl CheckAndResetState for LocomotiveSimulation {
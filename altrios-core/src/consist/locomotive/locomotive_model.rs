@@ -91,6 +91,15 @@ impl SaveState for PowertrainType {
         }
         Ok(())
     }
+
+    fn reserve_history(&mut self, n_steps: usize) {
+        match self {
+            PowertrainType::ConventionalLoco(conv) => conv.reserve_history(n_steps),
+            PowertrainType::HybridLoco(hel) => hel.reserve_history(n_steps),
+            PowertrainType::BatteryElectricLoco(bel) => bel.reserve_history(n_steps),
+            PowertrainType::DummyLoco(dummy) => dummy.reserve_history(n_steps),
+        }
+    }
 }
 
 impl Step for PowertrainType {
@@ -395,7 +404,7 @@ pub struct Locomotive {
     /// components between technologies, e.g. chassis, motors, trucks,
     /// cabin
     baseline_mass: Option<si::Mass>,
-    /// time step interval between saves.  1 is a good option.  If None,
+    /// time step interval between saves.  1 is a good option.  If None or 0,
     /// no saving occurs.
     save_interval: Option<usize>,
     /// Custom vector of [Self::state]
@@ -524,6 +533,11 @@ impl Locomotive {
         Ok(self.get_save_interval())
     }
 
+    #[getter]
+    fn get_history(&self) -> LocomotiveStateHistoryVec {
+        self.history.clone()
+    }
+
     #[getter]
     fn get_fc(&self) -> Option<FuelConverter> {
         self.fuel_converter().cloned()
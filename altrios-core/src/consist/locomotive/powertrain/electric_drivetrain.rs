@@ -25,7 +25,7 @@ pub struct ElectricDrivetrain {
     /// ElectricDrivetrain maximum output power assuming that positive and negative tractive powers have same magnitude
     pub pwr_out_max: si::Power,
     // TODO: add `mass` here
-    /// Time step interval between saves. 1 is a good option. If None, no saving occurs.
+    /// Time step interval between saves. 1 is a good option. If None or 0, no saving occurs.
     pub save_interval: Option<usize>,
     /// Custom vector of [Self::state] haha
     #[serde(default)]
@@ -41,7 +41,7 @@ pub struct FuelConverter {
     /// peak power, e.g. a value of 1 means no derating and a value of 0 means
     /// the engine is completely disabled.
     pub elev_and_temp_derate: Option<Interp2DOwned<f64, strategy::Linear>>,
-    /// time step interval between saves. 1 is a good option. If None, no saving occurs.
+    /// time step interval between saves. 1 is a good option. If None or 0, no saving occurs.
     pub save_interval: Option<usize>,
     /// Custom vector of [Self::state]
     #[serde(default)]
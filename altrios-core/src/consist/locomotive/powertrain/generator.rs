@@ -28,7 +28,7 @@ pub struct Generator {
     pub pwr_in_frac_interp: Vec<f64>,
     /// Generator max power out
     pub pwr_out_max: si::Power,
-    /// Time step interval between saves. 1 is a good option. If None, no saving occurs.
+    /// Time step interval between saves. 1 is a good option. If None or 0, no saving occurs.
     pub save_interval: Option<usize>,
     #[serde(default)]
     /// struct for tracking current state
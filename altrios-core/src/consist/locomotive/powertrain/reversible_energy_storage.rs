@@ -43,7 +43,7 @@ pub struct ReversibleEnergyStorage {
     pub min_soc: si::Ratio,
     /// Hard limit on maximum SOC, e.g. 0.95
     pub max_soc: si::Ratio,
-    /// Time step interval at which history is saved
+    /// Time step interval at which history is saved.  If None or 0, no saving occurs.
     pub save_interval: Option<usize>,
     #[serde(default)]
     /// Custom vector of [Self::state]
@@ -101,6 +101,11 @@ impl ReversibleEnergyStorage {
         )
     }
 
+    #[getter]
+    fn get_history(&self) -> ReversibleEnergyStorageStateHistoryVec {
+        self.history.clone()
+    }
+
     #[getter("eta_max")]
     fn get_eta_max_py(&self) -> f64 {
         self.get_eta_max()
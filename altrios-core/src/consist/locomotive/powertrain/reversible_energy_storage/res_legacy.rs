@@ -42,7 +42,7 @@ pub struct ReversibleEnergyStorageLegacy {
     /// SOC at which positive/discharge power begins to ramp down.
     /// Should always be slightly above [Self::min_soc].
     pub soc_lo_ramp_start: Option<si::Ratio>,
-    /// Time step interval at which history is saved
+    /// Time step interval at which history is saved.  If None or 0, no saving occurs.
     pub save_interval: Option<usize>,
     #[serde(default)]
     /// Custom vector of [Self::state]
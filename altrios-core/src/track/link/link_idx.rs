@@ -123,6 +123,14 @@ impl LinkPath {
     fn to_csv_file_py(&self, filepath: &Bound<PyAny>) -> anyhow::Result<()> {
         self.to_csv_file(PathBuf::extract_bound(filepath)?)
     }
+
+    #[staticmethod]
+    #[pyo3(name = "from_indices")]
+    /// Builds a link path from raw link indices (e.g. a list or integer array) in
+    /// one call rather than constructing a `LinkIdx` in Python for each element
+    fn from_indices_py(idxs: Vec<u32>) -> Self {
+        Self::from_indices(idxs)
+    }
 }
 
 impl Init for LinkPath {}
@@ -141,6 +149,11 @@ impl From<&Vec<LinkIdx>> for LinkPath {
 }
 
 impl LinkPath {
+    /// Build from raw link indices
+    pub fn from_indices(idxs: Vec<u32>) -> Self {
+        Self(idxs.into_iter().map(LinkIdx::new).collect())
+    }
+
     /// Load from csv file
     pub fn from_csv_file<P: AsRef<Path>>(filepath: P) -> anyhow::Result<Self> {
         let mut lp = vec![];
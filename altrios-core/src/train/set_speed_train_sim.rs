@@ -228,6 +228,13 @@ pub struct SetSpeedTrainSim {
 
 #[pyo3_api]
 impl SetSpeedTrainSim {
+    #[getter]
+    /// Train-level history only, so that Python callers needing time series do
+    /// not have to serialize the whole simulation via `to_pydict`
+    pub fn get_history(&self) -> TrainStateHistoryVec {
+        self.history.clone()
+    }
+
     #[getter]
     pub fn get_res_strap(&self) -> anyhow::Result<Option<method::Strap>> {
         match &self.train_res {
@@ -282,6 +289,8 @@ pub struct SetSpeedTrainSimBuilder {
     pub speed_trace: SpeedTrace,
     pub train_res: TrainRes,
     pub path_tpc: PathTpc,
+    /// Time step interval between saves. 1 is a good option. If `None` or 0, no
+    /// history is saved, which is fastest when only final results are needed.
     pub save_interval: Option<usize>,
     /// Time-dependent temperature at sea level that can be corrected for altitude using a standard model
     pub temp_trace: Option<TemperatureTrace>,
@@ -441,6 +450,7 @@ impl SetSpeedTrainSim {
 
     /// Iterates `save_state` and `step` through all time steps.
     pub fn walk(&mut self) -> anyhow::Result<()> {
+        self.reserve_history(self.speed_trace.len());
         self.save_state(|| format_dbg!())?;
         loop {
             if *self.state.i.get_fresh(|| format_dbg!())? > self.speed_trace.len() - 2 {
@@ -583,7 +593,7 @@ impl Step for SetSpeedTrainSim {
 impl SaveState for SetSpeedTrainSim {
     /// Saves current time step for self and nested `loco_con`.
     fn save_state<F: Fn() -> String>(&mut self, _loc: F) -> anyhow::Result<()> {
-        if let Some(interval) = self.save_interval {
+        if let Some(interval) = self.save_interval.filter(|interval| *interval > 0) {
             if self.state.i.get_fresh(|| format_dbg!())? % interval == 0 {
                 self.history.push(self.state.clone());
                 self.loco_con.save_state(|| format_dbg!())?;
@@ -591,6 +601,13 @@ impl SaveState for SetSpeedTrainSim {
         }
         Ok(())
     }
+
+    fn reserve_history(&mut self, n_steps: usize) {
+        if let Some(interval) = self.save_interval.filter(|interval| *interval > 0) {
+            self.history.reserve(history_capacity(n_steps, interval));
+            self.loco_con.reserve_history(n_steps);
+        }
+    }
 }
 impl Init for SetSpeedTrainSim {
     fn init(&mut self) -> Result<(), Error> {
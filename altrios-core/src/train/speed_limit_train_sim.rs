@@ -2,7 +2,7 @@ use super::environment::TemperatureTrace;
 use super::{braking_point::BrakingPoints, friction_brakes::*, train_imports::*};
 use crate::imports::*;
 use crate::track::link::network::Network;
-use crate::track::{LinkPoint, Location};
+use crate::track::{LinkPath, LinkPoint, Location};
 
 #[serde_api]
 #[derive(Debug, Default, Clone, Copy, PartialEq, Serialize, Deserialize)]
@@ -37,7 +37,14 @@ impl LinkIdxTime {
 pub struct TimedLinkPath(pub Vec<LinkIdxTime>);
 
 #[pyo3_api]
-impl TimedLinkPath {}
+impl TimedLinkPath {
+    #[pyo3(name = "to_link_path")]
+    /// Link path without the times, built without converting each `LinkIdxTime` to
+    /// a Python object
+    fn to_link_path_py(&self) -> LinkPath {
+        self.to_link_path()
+    }
+}
 
 impl Init for TimedLinkPath {}
 impl SerdeAPI for TimedLinkPath {}
@@ -47,6 +54,11 @@ impl TimedLinkPath {
     pub fn new(value: Vec<LinkIdxTime>) -> Self {
         Self(value)
     }
+
+    /// Returns the link indices in order, dropping the times.
+    pub fn to_link_path(&self) -> LinkPath {
+        LinkPath(self.0.iter().map(|lit| lit.link_idx).collect())
+    }
 }
 
 impl AsRef<[LinkIdxTime]> for TimedLinkPath {
@@ -100,6 +112,13 @@ pub struct SpeedLimitTrainSim {
 
 #[pyo3_api]
 impl SpeedLimitTrainSim {
+    #[getter]
+    /// Train-level history only, so that Python callers needing time series do
+    /// not have to serialize the whole simulation via `to_pydict`
+    pub fn get_history(&self) -> TrainStateHistoryVec {
+        self.history.clone()
+    }
+
     #[pyo3(name = "set_save_interval")]
     #[pyo3(signature = (save_interval=None))]
     /// Set save interval and cascade to nested components.
@@ -229,6 +248,8 @@ pub struct SpeedLimitTrainSimBuilder {
     pub train_res: TrainRes,
     pub path_tpc: PathTpc,
     pub fric_brake: FricBrake,
+    /// Time step interval between saves. 1 is a good option. If `None` or 0, no
+    /// history is saved, which is fastest when only final results are needed.
     pub save_interval: Option<usize>,
     pub simulation_days: Option<i32>,
     pub scenario_year: Option<i32>,
@@ -1074,7 +1095,7 @@ impl SetCumulative for SpeedLimitTrainSim {
 }
 impl SaveState for SpeedLimitTrainSim {
     fn save_state<F: Fn() -> String>(&mut self, loc: F) -> anyhow::Result<()> {
-        if let Some(interval) = self.save_interval {
+        if let Some(interval) = self.save_interval.filter(|interval| *interval > 0) {
             if self
                 .state
                 .i
@@ -195,6 +195,21 @@ pub trait SaveState {
     /// # Arguments
     /// - `loc`: closure that returns file and line number where called
     fn save_state<F: Fn() -> String>(&mut self, loc: F) -> anyhow::Result<()>;
+
+    /// Reserves space in `self.history`, and in the history of any fields with `state`, for a
+    /// simulation of `n_steps` time steps so that history vecs are not repeatedly reallocated
+    /// while the simulation runs
+    /// # Arguments
+    /// - `n_steps`: expected number of time steps in the simulation
+    fn reserve_history(&mut self, _n_steps: usize) {}
+}
+
+/// Returns the number of history entries to reserve for a simulation of `n_steps` time
+/// steps that saves state every `save_interval` steps.  States are saved at every
+/// `save_interval`th step counting from step 0, and the derived `SaveState` impls also
+/// save step 1, so no more than `n_steps / save_interval + 2` entries are pushed.
+pub fn history_capacity(n_steps: usize, save_interval: usize) -> usize {
+    n_steps / save_interval + 2
 }
 
 /// Trait that provides method for incrementing `i` field of this and all contained structs,
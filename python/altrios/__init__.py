@@ -1,4 +1,5 @@
 from importlib.metadata import version
+import functools
 
 __version__ = version("altrios")
 
@@ -232,11 +233,35 @@ def to_dataframe(
     return df
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_from_file(cls, filepath: str, mtime_ns: int, skip_init: bool):
+    # `mtime_ns` is only part of the cache key so that edited files get reloaded
+    return cls.from_file(filepath, skip_init=skip_init)
+
+
+@classmethod  # type: ignore[misc]
+def from_file_cached(cls, filepath: Union[str, Path], skip_init: bool = False) -> Self:  # type: ignore[misc]
+    """
+    Same as `from_file` but caches the deserialized object, keyed on resolved path
+    and modification time, so that repeated loads in the same interpreter (e.g.
+    notebook cell reruns or a pytest session) skip reading and parsing the file.
+    Returns a copy so that mutating the returned object does not affect the cache.
+    # Arguments
+    - `filepath`: file from which to read the object
+    - `skip_init`: passed to `from_file`
+    """
+    filepath = Path(filepath).resolve()
+    return _cached_from_file(
+        cls, str(filepath), filepath.stat().st_mtime_ns, skip_init
+    ).copy()
+
+
 # adds variable_path_list() and history_path_list() as methods to all classes in
 # ACCEPTED_RUST_STRUCTS
 for item in ACCEPTED_RUST_STRUCTS:
     setattr(getattr(altrios_pyo3, item), "to_pydict", to_pydict)  # noqa: F405
     setattr(getattr(altrios_pyo3, item), "from_pydict", from_pydict)  # noqa: F405
     setattr(getattr(altrios_pyo3, item), "to_dataframe", to_dataframe)  # noqa: F405
+    setattr(getattr(altrios_pyo3, item), "from_file_cached", from_file_cached)  # noqa: F405
 
 setattr(ReversibleEnergyStorage, "from_excel", classmethod(_res_from_excel))  # noqa: F405
@@ -17,6 +17,8 @@ class SerdeAPI(object):
     def from_yaml(cls) -> Self: ...
     @classmethod
     def from_file(cls, skip_init=False) -> Self: ...
+    @classmethod
+    def from_file_cached(cls, filepath, skip_init=False) -> Self: ...
     def to_file(self): ...
     def to_bincode(self) -> bytes: ...
     def to_json(self) -> str: ...
@@ -38,10 +40,17 @@ class Consist(SerdeAPI):
     def clone(self) -> Self: ...
     @classmethod
     def default(cls) -> Self: ...
+    @classmethod
+    def from_locos_and_n_default(
+        cls,
+        loco_vec: List[Locomotive],
+        n_default: int,
+        save_interval: Optional[int] = None,
+    ) -> Self: ...
     def get_save_interval(self) -> int: ...
     def set_pdct_prop(self) -> None: ...
     def set_pdct_resgreedy(self) -> None: ...
-    def set_save_interval(self, save_interval: int): ...
+    def set_save_interval(self, save_interval: Optional[int]): ...
     def __copy__(self) -> Self: ...
 
 class ConsistSimulation(SerdeAPI):
@@ -54,7 +63,7 @@ class ConsistSimulation(SerdeAPI):
     @classmethod
     def default(cls) -> Self: ...
     def get_save_interval(self) -> int: ...
-    def set_save_interval(self, save_interval: int): ...
+    def set_save_interval(self, save_interval: Optional[int]): ...
     def walk(self) -> None: ...
     def __copy__(self) -> Self: ...
 
@@ -355,7 +364,7 @@ class Locomotive(SerdeAPI):
     @classmethod
     def default(cls) -> Self: ...
     def get_save_interval(self) -> Any: ...
-    def set_save_interval(self, save_interval: int): ...
+    def set_save_interval(self, save_interval: Optional[int]): ...
     def __copy__(self) -> Self: ...
 
 class LocomotiveSimulation(SerdeAPI):
@@ -366,7 +375,7 @@ class LocomotiveSimulation(SerdeAPI):
     def __init__(cls) -> None: ...
     def clone(self) -> Self: ...
     def get_save_interval(self) -> int: ...
-    def set_save_interval(self, save_interval: int): ...
+    def set_save_interval(self, save_interval: Optional[int]): ...
     def walk(self) -> None: ...
     def __copy__(self) -> Self: ...
 
@@ -634,7 +643,7 @@ class SetSpeedTrainSim(SerdeAPI):
     @classmethod
     def default(cls) -> Self: ...
     def __copy__(self) -> Self: ...
-    def set_save_interval(self, save_interval: int): ...
+    def set_save_interval(self, save_interval: Optional[int]): ...
 
 class LinkPoint(SerdeAPI):
     offset_meters: float
@@ -737,7 +746,7 @@ class SpeedLimitTrainSim(SerdeAPI):
     @classmethod
     def default(cls) -> Self: ...
     def __copy__(self) -> Self: ...
-    def set_save_interval(self, save_interval: int): ...
+    def set_save_interval(self, save_interval: Optional[int]): ...
     def walk(self): ...
     def walk_timed_path(self, network: Network, timed_path: List[LinkIdxTime]): ...
 
@@ -747,7 +756,7 @@ class SpeedLimitTrainSimVec(SerdeAPI):
     @classmethod
     def default(cls) -> Self: ...
     def tolist(self) -> List[SpeedLimitTrainSim]: ...
-    def set_save_interval(self, save_interval: int): ...
+    def set_save_interval(self, save_interval: Optional[int]): ...
 
 @dataclass
 class LinkIdx(SerdeAPI):
@@ -910,6 +919,7 @@ class TimedLinkPath(SerdeAPI):
     def default(cls) -> Self: ...
     def is_empty(self) -> bool: ...
     def tolist(self) -> List[LinkIdxTime]: ...
+    def to_link_path(self) -> LinkPath: ...
     def __copy__(self) -> Self: ...
     def __delitem__(self, other) -> None: ...
     def __getitem__(self, index) -> LinkIdxTime: ...
@@ -945,6 +955,8 @@ class LinkPath(SerdeAPI):
     def default(cls) -> Self: ...
     def is_empty(self) -> bool: ...
     def tolist(self) -> List[LinkIdx]: ...
+    @classmethod
+    def from_indices(cls, idxs: List[int]) -> Self: ...
     def __copy__(self) -> Self: ...
     def __delitem__(self, other) -> None: ...
     def __getitem__(self, index) -> LinkIdx: ...
@@ -14,7 +14,7 @@ sns.set_theme()
 SHOW_PLOTS = alt.utils.show_plots()
 
 # %%
-SAVE_INTERVAL = 1
+SAVE_INTERVAL = 1 if SHOW_PLOTS else None
 # load hybrid consist
 t0 = time.perf_counter()
 fc = alt.FuelConverter.default()
@@ -53,63 +53,69 @@ print(f"Time to simulate: {t1 - t0:.5g}")
 # %%
 
 
-sim_dict = sim.to_pydict()
-conv_rslt = sim_dict["loco_unit"]
-t_s = np.array(sim_dict["power_trace"]["time_seconds"])
-
-fig, ax = plt.subplots(2, 1, sharex=True, figsize=(10, 12))
-
-# power
-fontsize = 16
-
-i = 0
-
-ax[i].plot(
-    t_s,
-    np.array(
-        conv_rslt["loco_type"]["ConventionalLoco"]["fc"]["history"]["pwr_fuel_watts"]
+if SHOW_PLOTS:
+    sim_dict = sim.to_pydict()
+    conv_rslt = sim_dict["loco_unit"]
+    t_s = np.asarray(sim_dict["power_trace"]["time_seconds"], dtype=np.float64)
+
+    fig, ax = plt.subplots(2, 1, sharex=True, figsize=(10, 12))
+
+    # power
+    fontsize = 16
+
+    i = 0
+
+    ax[i].plot(
+        t_s,
+        np.asarray(
+            conv_rslt["loco_type"]["ConventionalLoco"]["fc"]["history"][
+                "pwr_fuel_watts"
+            ],
+            dtype=np.float64,
+        )
+        * 1e-6,
+        label="fc pwr_out_fuel",
     )
-    * 1e-6,
-    label="fc pwr_out_fuel",
-)
-ax[i].plot(
-    t_s,
-    np.array(
-        conv_rslt["loco_type"]["ConventionalLoco"]["fc"]["history"]["pwr_out_max_watts"]
+    ax[i].plot(
+        t_s,
+        np.asarray(
+            conv_rslt["loco_type"]["ConventionalLoco"]["fc"]["history"][
+                "pwr_out_max_watts"
+            ],
+            dtype=np.float64,
+        )
+        * 1e-6,
+        label="fc pwr_out_max",
+    )
+    ax[i].plot(
+        t_s,
+        np.asarray(conv_rslt["history"]["pwr_out_max_watts"], dtype=np.float64) * 1e-6,
+        label="loco pwr_out_max",
+    )
+    ax[i].plot(
+        t_s,
+        np.asarray(conv_rslt["history"]["pwr_out_watts"], dtype=np.float64) * 1e-6,
+        label="loco pwr_out",
+    )
+    ax[i].plot(
+        t_s,
+        np.asarray(sim_dict["power_trace"]["pwr_watts"], dtype=np.float64) * 1e-6,
+        linestyle="--",
+        label="power_trace",
     )
-    * 1e-6,
-    label="fc pwr_out_max",
-)
-ax[i].plot(
-    t_s,
-    np.array(conv_rslt["history"]["pwr_out_max_watts"]) * 1e-6,
-    label="loco pwr_out_max",
-)
-ax[i].plot(
-    t_s,
-    np.array(conv_rslt["history"]["pwr_out_watts"]) * 1e-6,
-    label="loco pwr_out",
-)
-ax[i].plot(
-    t_s,
-    np.array(sim_dict["power_trace"]["pwr_watts"]) * 1e-6,
-    linestyle="--",
-    label="power_trace",
-)
 
-ax[i].tick_params(labelsize=fontsize)
+    ax[i].tick_params(labelsize=fontsize)
 
-ax[i].set_ylabel("Power [MW]", fontsize=fontsize)
-ax[i].legend(fontsize=fontsize)
+    ax[i].set_ylabel("Power [MW]", fontsize=fontsize)
+    ax[i].legend(fontsize=fontsize)
 
-i += 1
-ax[i].plot(
-    t_s,
-    np.array(sim_dict["loco_unit"]["history"]["pwr_out_watts"]),
-)
-ax[i].set_ylabel("Total Tractive\nEffort [MW]", fontsize=fontsize)
+    i += 1
+    ax[i].plot(
+        t_s,
+        np.asarray(sim_dict["loco_unit"]["history"]["pwr_out_watts"], dtype=np.float64),
+    )
+    ax[i].set_ylabel("Total Tractive\nEffort [MW]", fontsize=fontsize)
 
-if SHOW_PLOTS:
     plt.tight_layout()
     plt.show()
 # %%
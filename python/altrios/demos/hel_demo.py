@@ -15,7 +15,7 @@ sns.set_theme()
 SHOW_PLOTS = alt.utils.show_plots()
 
 
-SAVE_INTERVAL = 1
+SAVE_INTERVAL = 1 if SHOW_PLOTS else None
 
 
 pt = alt.PowerTrace.default()
@@ -34,58 +34,58 @@ sim.walk()
 t1 = time.perf_counter()
 print(f"Time to simulate: {t1 - t0:.5g}")
 
-sim_dict = sim.to_pydict()
-hel_rslt = sim_dict["loco_unit"]
-t_s = np.array(sim_dict["power_trace"]["time_seconds"])
+if SHOW_PLOTS:
+    # convert only the histories being plotted rather than the whole simulation
+    loco_unit = sim.loco_unit
+    loco_hist = loco_unit.history.to_pydict()
+    res_hist = loco_unit.res.history.to_pydict()
+    pt_dict = pt.to_pydict()
+    t_s = np.asarray(pt_dict["time_seconds"], dtype=np.float64)
 
-fig, ax = plt.subplots(3, 1, sharex=True, figsize=(10, 12))
+    fig, ax = plt.subplots(3, 1, sharex=True, figsize=(10, 12))
 
-# power
-fontsize = 16
+    # power
+    fontsize = 16
 
-i = 0
+    i = 0
 
-ax[i].plot(
-    t_s,
-    np.array(
-        hel_rslt["loco_type"]["HybridLoco"]["res"]["history"]["pwr_out_chemical_watts"]
+    ax[i].plot(
+        t_s,
+        np.asarray(res_hist["pwr_out_chemical_watts"], dtype=np.float64) * 1e-6,
+        label="pwr_out_chem",
+    )
+    ax[i].plot(
+        t_s,
+        np.asarray(loco_hist["pwr_out_watts"], dtype=np.float64) * 1e-6,
+        label="loco pwr_out",
+    )
+    ax[i].plot(
+        t_s,
+        np.asarray(pt_dict["pwr_watts"], dtype=np.float64) * 1e-6,
+        linestyle="--",
+        label="power_trace",
     )
-    * 1e-6,
-    label="pwr_out_chem",
-)
-ax[i].plot(
-    t_s,
-    np.array(hel_rslt["history"]["pwr_out_watts"]) * 1e-6,
-    label="loco pwr_out",
-)
-ax[i].plot(
-    t_s,
-    np.array(sim_dict["power_trace"]["pwr_watts"]) * 1e-6,
-    linestyle="--",
-    label="power_trace",
-)
-
-ax[i].tick_params(labelsize=fontsize)
-
-ax[i].set_ylabel("Power [MW]", fontsize=fontsize)
-ax[i].legend(fontsize=fontsize)
-
-i += 1
-ax[i].plot(
-    t_s,
-    np.array(sim_dict["loco_unit"]["history"]["pwr_out_watts"]),
-)
-ax[i].set_ylabel("Total Tractive\nEffort [MW]", fontsize=fontsize)
-
-i += 1
-ax[i].plot(
-    t_s,
-    np.array(hel_rslt["loco_type"]["HybridLoco"]["res"]["history"]["soc"]),
-    label="SOC",
-)
-ax[i].set_ylabel("SOC", fontsize=fontsize)
-ax[i].tick_params(labelsize=fontsize)
 
-if SHOW_PLOTS:
+    ax[i].tick_params(labelsize=fontsize)
+
+    ax[i].set_ylabel("Power [MW]", fontsize=fontsize)
+    ax[i].legend(fontsize=fontsize)
+
+    i += 1
+    ax[i].plot(
+        t_s,
+        np.asarray(loco_hist["pwr_out_watts"], dtype=np.float64),
+    )
+    ax[i].set_ylabel("Total Tractive\nEffort [MW]", fontsize=fontsize)
+
+    i += 1
+    ax[i].plot(
+        t_s,
+        np.asarray(res_hist["soc"], dtype=np.float64),
+        label="SOC",
+    )
+    ax[i].set_ylabel("SOC", fontsize=fontsize)
+    ax[i].tick_params(labelsize=fontsize)
+
     plt.tight_layout()
     plt.show()
@@ -1,8 +1,69 @@
 import altrios as alt
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import numpy as np
 from typing import Tuple
 
+# history field and scale factor for each unit-converted series used in the plots
+# below, in the order returned by `_rescale_history`
+_HISTORY_UNITS = (
+    ("time_seconds", 1.0 / 3_600),  # hr
+    ("offset_back_meters", 1e-3),  # km
+    ("pwr_whl_out_watts", 1e-6),  # MW
+    ("res_aero_newtons", 1e-3),  # kN
+    ("res_rolling_newtons", 1e-3),  # kN
+    ("res_curve_newtons", 1e-3),  # kN
+    ("res_bearing_newtons", 1e-3),  # kN
+    ("res_grade_newtons", 1e-3),  # kN
+    ("offset_in_link_meters", 1e-3),  # km
+    ("offset_meters", 1e-3),  # km
+    ("grade_front", 100.0),  # %
+)
+
+
+def _rescale_history(hist: dict) -> np.ndarray:
+    """
+    Converts the train-level history fields in `_HISTORY_UNITS` to plotting units.
+    Callers pass `ts.history.to_pydict()` rather than the much larger
+    `ts.to_pydict()` because only the train-level history is needed.
+    All fields are copied into one contiguous 2D array and scaled in place in a
+    single vectorized pass, so unpacking the result yields one row view per field.
+    """
+    raw = np.array([hist[key] for key, _ in _HISTORY_UNITS], dtype=np.float64)
+    scales = np.array([scale for _, scale in _HISTORY_UNITS])
+    np.multiply(raw, scales[:, np.newaxis], out=raw)
+    return raw
+
+
+def _scaled(values, scale: float) -> np.ndarray:
+    """
+    Returns `values` as a new float64 array multiplied by `scale` in place, so each
+    unit conversion costs one allocation rather than two.
+    """
+    arr = np.array(values, dtype=np.float64)
+    arr *= scale
+    return arr
+
+
+def _plot_resistances(
+    ax: plt.Axes, x: np.ndarray, resistances: Tuple[np.ndarray, ...]
+) -> None:
+    """
+    Draws the aero, rolling, curve, bearing, and grade resistance components on `ax` as
+    a single `LineCollection` rather than one `Line2D` per component.
+    """
+    labels = ("aero", "rolling", "curve", "bearing", "grade")
+    colors = plt.rcParams["axes.prop_cycle"].by_key()["color"][: len(labels)]
+    ax.add_collection(
+        LineCollection([np.column_stack((x, y)) for y in resistances], colors=colors)
+    )
+    ax.autoscale_view()
+    # the collection has one artist, so legend entries need proxy handles
+    ax.legend(
+        handles=[Line2D([], [], color=c, label=lbl) for c, lbl in zip(colors, labels)]
+    )
+
 
 def extract_bel_from_train_sim(ts: alt.SetSpeedTrainSim) -> list:
     ts_dict = ts.to_pydict()
@@ -52,19 +113,35 @@ def plot_locos_from_ts(ts: alt.SetSpeedTrainSim, x: str, show_plots: bool = Fals
     x: ["time","offset"]
     """
     ts_dict = ts.to_pydict()
+    # convert each history field to a plottable array once and reuse it below
+    hist = ts_dict["history"]
+    (
+        t_hr,
+        offset_back_km,
+        pwr_whl_out_mw,
+        res_aero_kn,
+        res_rolling_kn,
+        res_curve_kn,
+        res_bearing_kn,
+        res_grade_kn,
+        offset_in_link_km,
+        offset_km,
+        grade_front_pct,
+    ) = _rescale_history(hist)
     if isinstance(ts, alt.SpeedLimitTrainSim):
         plot_title = "Speed Limit Train Sim"
     if isinstance(ts, alt.SetSpeedTrainSim):
         plot_title = "Set Speed Train Sim"
     if x == "time" or x == "Time":
-        x_axis = np.array(ts_dict["history"]["time_seconds"]) / 3_600
+        x_axis = t_hr
         x_label = "Time (hr)"
     if x == "distance" or x == "Distance":
-        x_axis = np.array(ts_dict["history"]["offset_back_meters"]) / 1_000
+        x_axis = offset_back_km
         x_label = "Distance (km)"
     first_bel = []
     first_hel = []
 
+    # each branch stacks all of its axes in one figure so that layout is done once
     if extract_bel_from_train_sim(ts):
         first_bel = extract_bel_from_train_sim(ts)[0]
         """
@@ -74,47 +151,28 @@ def plot_locos_from_ts(ts: alt.SetSpeedTrainSim, x: str, show_plots: bool = Fals
         various powers along the powertrain vs dist or time
         various cumulative energies along the powertrain vs dist or time
         """
-        fig, ax = plt.subplots(4, 1, sharex=True)
+        fig, axes = plt.subplots(10, 1, sharex=True, figsize=(10, 20))
+        ax, ax1, ax2 = axes[:4], axes[4:7], axes[7:]
         ax[0].plot(
             x_axis,
-            np.array(ts_dict["history"]["pwr_whl_out_watts"]) / 1e6,
+            pwr_whl_out_mw,
             label="tract pwr",
         )
         ax[0].set_ylabel("Power [MW]")
         ax[0].legend()
 
-        ax[1].plot(
-            x_axis,
-            np.array(ts_dict["history"]["res_aero_newtons"]) / 1e3,
-            label="aero",
-        )
-        ax[1].plot(
-            x_axis,
-            np.array(ts_dict["history"]["res_rolling_newtons"]) / 1e3,
-            label="rolling",
-        )
-        ax[1].plot(
+        _plot_resistances(
+            ax[1],
             x_axis,
-            np.array(ts_dict["history"]["res_curve_newtons"]) / 1e3,
-            label="curve",
-        )
-        ax[1].plot(
-            x_axis,
-            np.array(ts_dict["history"]["res_bearing_newtons"]) / 1e3,
-            label="bearing",
-        )
-        ax[1].plot(
-            x_axis,
-            np.array(ts_dict["history"]["res_grade_newtons"]) / 1e3,
-            label="grade",
+            (res_aero_kn, res_rolling_kn, res_curve_kn, res_bearing_kn, res_grade_kn),
         )
         ax[1].set_ylabel("Force [MN]")
-        ax[1].legend()
 
         ax[2].plot(
             x_axis,
-            np.array(
-                first_bel["loco_type"]["BatteryElectricLoco"]["res"]["history"]["soc"]
+            np.asarray(
+                first_bel["loco_type"]["BatteryElectricLoco"]["res"]["history"]["soc"],
+                dtype=np.float64,
             ),
         )
         ax[2].set_ylabel("SOC")
@@ -130,20 +188,18 @@ def plot_locos_from_ts(ts: alt.SetSpeedTrainSim, x: str, show_plots: bool = Fals
                 ts_dict["history"]["speed_limit_meters_per_second"],
                 label="limit",
             )
-        ax[-1].set_xlabel(x_label)
         ax[-1].set_ylabel("Speed [m/s]")
         ax[-1].legend()
-        plt.suptitle(plot_title + " " + "Train Resistance, BEL SOC and Train Speed")
+        ax[0].set_title("Train Resistance, BEL SOC and Train Speed")
 
-        fig1, ax1 = plt.subplots(3, 1, sharex=True)
         ax1[0].plot(
             x_axis,
-            np.array(ts_dict["history"]["offset_in_link_meters"]) / 1_000,
+            offset_in_link_km,
             label="current link",
         )
         ax1[0].plot(
             x_axis,
-            np.array(ts_dict["history"]["offset_meters"]) / 1_000,
+            offset_km,
             label="overall",
         )
         ax1[0].legend()
@@ -161,16 +217,13 @@ def plot_locos_from_ts(ts: alt.SetSpeedTrainSim, x: str, show_plots: bool = Fals
             x_axis,
             ts_dict["history"]["speed_meters_per_second"],
         )
-        ax1[-1].set_xlabel(x_label)
         ax1[-1].set_ylabel("Speed [m/s]")
 
-        plt.suptitle(plot_title + " " + "Distance and Link Tracking")
-        plt.tight_layout()
+        ax1[0].set_title("Distance and Link Tracking")
 
-        fig2, ax2 = plt.subplots(3, 1, sharex=True)
         ax2[0].plot(
             x_axis,
-            np.array(ts_dict["history"]["pwr_whl_out_watts"]) / 1e6,
+            pwr_whl_out_mw,
             label="tract pwr",
         )
         ax2[0].set_ylabel("Power [MW]")
@@ -178,7 +231,7 @@ def plot_locos_from_ts(ts: alt.SetSpeedTrainSim, x: str, show_plots: bool = Fals
 
         ax2[1].plot(
             x_axis,
-            np.array(ts_dict["history"]["grade_front"]) * 100.0,
+            grade_front_pct,
         )
         ax2[1].set_ylabel("Grade [%] at\nHead End")
 
@@ -189,48 +242,29 @@ def plot_locos_from_ts(ts: alt.SetSpeedTrainSim, x: str, show_plots: bool = Fals
         ax2[-1].set_xlabel(x_label)
         ax2[-1].set_ylabel("Speed [m/s]")
 
-        plt.suptitle(plot_title + " " + "Power and Grade Profile")
-        plt.tight_layout()
+        ax2[0].set_title("Power and Grade Profile")
+        fig.suptitle(plot_title)
+        fig.tight_layout()
         if show_plots:
             plt.show()
 
     if extract_conv_from_train_sim(ts) is not False:
-        fig, ax = plt.subplots(3, 1, sharex=True)
+        fig, axes = plt.subplots(9, 1, sharex=True, figsize=(10, 18))
+        ax, ax1, ax2 = axes[:3], axes[3:6], axes[6:]
         ax[0].plot(
             x_axis,
-            np.array(ts_dict["history"]["pwr_whl_out_watts"]) / 1e6,
+            pwr_whl_out_mw,
             label="tract pwr",
         )
         ax[0].set_ylabel("Power [MW]")
         ax[0].legend()
 
-        ax[1].plot(
-            x_axis,
-            np.array(ts_dict["history"]["res_aero_newtons"]) / 1e3,
-            label="aero",
-        )
-        ax[1].plot(
-            x_axis,
-            np.array(ts_dict["history"]["res_rolling_newtons"]) / 1e3,
-            label="rolling",
-        )
-        ax[1].plot(
+        _plot_resistances(
+            ax[1],
             x_axis,
-            np.array(ts_dict["history"]["res_curve_newtons"]) / 1e3,
-            label="curve",
-        )
-        ax[1].plot(
-            x_axis,
-            np.array(ts_dict["history"]["res_bearing_newtons"]) / 1e3,
-            label="bearing",
-        )
-        ax[1].plot(
-            x_axis,
-            np.array(ts_dict["history"]["res_grade_newtons"]) / 1e3,
-            label="grade",
+            (res_aero_kn, res_rolling_kn, res_curve_kn, res_bearing_kn, res_grade_kn),
         )
         ax[1].set_ylabel("Force [MN]")
-        ax[1].legend()
         ax[-1].plot(
             x_axis,
             ts_dict["history"]["speed_meters_per_second"],
@@ -242,20 +276,18 @@ def plot_locos_from_ts(ts: alt.SetSpeedTrainSim, x: str, show_plots: bool = Fals
                 ts_dict["history"]["speed_limit_meters_per_second"],
                 label="limit",
             )
-        ax[-1].set_xlabel(x_label)
         ax[-1].set_ylabel("Speed [m/s]")
         ax[-1].legend()
-        plt.suptitle(plot_title + " " + "Train Resistance, and Train Speed")
+        ax[0].set_title("Train Resistance, and Train Speed")
 
-        fig1, ax1 = plt.subplots(3, 1, sharex=True)
         ax1[0].plot(
             x_axis,
-            np.array(ts_dict["history"]["offset_in_link_meters"]) / 1_000,
+            offset_in_link_km,
             label="current link",
         )
         ax1[0].plot(
             x_axis,
-            np.array(ts_dict["history"]["offset_meters"]) / 1_000,
+            offset_km,
             label="overall",
         )
         ax1[0].legend()
@@ -273,16 +305,13 @@ def plot_locos_from_ts(ts: alt.SetSpeedTrainSim, x: str, show_plots: bool = Fals
             x_axis,
             ts_dict["history"]["speed_meters_per_second"],
         )
-        ax1[-1].set_xlabel(x_label)
         ax1[-1].set_ylabel("Speed [m/s]")
 
-        plt.suptitle(plot_title + " " + "Distance and Link Tracking")
-        plt.tight_layout()
+        ax1[0].set_title("Distance and Link Tracking")
 
-        fig2, ax2 = plt.subplots(3, 1, sharex=True)
         ax2[0].plot(
             x_axis,
-            np.array(ts_dict["history"]["pwr_whl_out_watts"]) / 1e6,
+            pwr_whl_out_mw,
             label="tract pwr",
         )
         ax2[0].set_ylabel("Power [MW]")
@@ -290,7 +319,7 @@ def plot_locos_from_ts(ts: alt.SetSpeedTrainSim, x: str, show_plots: bool = Fals
 
         ax2[1].plot(
             x_axis,
-            np.array(ts_dict["history"]["grade_front"]) * 100.0,
+            grade_front_pct,
         )
         ax2[1].set_ylabel("Grade [%] at\nHead End")
 
@@ -301,53 +330,37 @@ def plot_locos_from_ts(ts: alt.SetSpeedTrainSim, x: str, show_plots: bool = Fals
         ax2[-1].set_xlabel(x_label)
         ax2[-1].set_ylabel("Speed [m/s]")
 
-        plt.suptitle(plot_title + " " + "Power and Grade Profile")
-        plt.tight_layout()
+        ax2[0].set_title("Power and Grade Profile")
+        fig.suptitle(plot_title)
+        fig.tight_layout()
         if show_plots:
             plt.show()
 
     if extract_hel_from_train_sim(ts) is not False:
         first_hel = extract_hel_from_train_sim(ts)[0]
-        fig, ax = plt.subplots(4, 1, sharex=True)
+        fig, axes = plt.subplots(13, 1, sharex=True, figsize=(10, 26))
+        ax, ax1, ax2, ax3 = axes[:4], axes[4:7], axes[7:10], axes[10:]
         ax[0].plot(
             x_axis,
-            np.array(ts_dict["history"]["pwr_whl_out_watts"]) / 1e6,
+            pwr_whl_out_mw,
             label="tract pwr",
         )
         ax[0].set_ylabel("Power [MW]")
         ax[0].legend()
 
-        ax[1].plot(
-            x_axis,
-            np.array(ts_dict["history"]["res_aero_newtons"]) / 1e3,
-            label="aero",
-        )
-        ax[1].plot(
-            x_axis,
-            np.array(ts_dict["history"]["res_rolling_newtons"]) / 1e3,
-            label="rolling",
-        )
-        ax[1].plot(
+        _plot_resistances(
+            ax[1],
             x_axis,
-            np.array(ts_dict["history"]["res_curve_newtons"]) / 1e3,
-            label="curve",
-        )
-        ax[1].plot(
-            x_axis,
-            np.array(ts_dict["history"]["res_bearing_newtons"]) / 1e3,
-            label="bearing",
-        )
-        ax[1].plot(
-            x_axis,
-            np.array(ts_dict["history"]["res_grade_newtons"]) / 1e3,
-            label="grade",
+            (res_aero_kn, res_rolling_kn, res_curve_kn, res_bearing_kn, res_grade_kn),
         )
         ax[1].set_ylabel("Force [MN]")
-        ax[1].legend()
 
         ax[2].plot(
             x_axis,
-            np.array(first_hel["loco_type"]["HybridLoco"]["res"]["history"]["soc"]),
+            np.asarray(
+                first_hel["loco_type"]["HybridLoco"]["res"]["history"]["soc"],
+                dtype=np.float64,
+            ),
         )
         ax[2].set_ylabel("SOC")
 
@@ -362,20 +375,18 @@ def plot_locos_from_ts(ts: alt.SetSpeedTrainSim, x: str, show_plots: bool = Fals
                 ts_dict["history"]["speed_limit_meters_per_second"],
                 label="limit",
             )
-        ax[-1].set_xlabel(x_label)
         ax[-1].set_ylabel("Speed [m/s]")
         ax[-1].legend()
-        plt.suptitle(plot_title + " " + "Train Resistance, BEL SOC and Train Speed")
+        ax[0].set_title("Train Resistance, BEL SOC and Train Speed")
 
-        fig1, ax1 = plt.subplots(3, 1, sharex=True)
         ax1[0].plot(
             x_axis,
-            np.array(ts_dict["history"]["offset_in_link_meters"]) / 1_000,
+            offset_in_link_km,
             label="current link",
         )
         ax1[0].plot(
             x_axis,
-            np.array(ts_dict["history"]["offset_meters"]) / 1_000,
+            offset_km,
             label="overall",
         )
         ax1[0].legend()
@@ -393,16 +404,13 @@ def plot_locos_from_ts(ts: alt.SetSpeedTrainSim, x: str, show_plots: bool = Fals
             x_axis,
             ts_dict["history"]["speed_meters_per_second"],
         )
-        ax1[-1].set_xlabel(x_label)
         ax1[-1].set_ylabel("Speed [m/s]")
 
-        plt.suptitle(plot_title + " " + "Distance and Link Tracking")
-        plt.tight_layout()
+        ax1[0].set_title("Distance and Link Tracking")
 
-        fig2, ax2 = plt.subplots(3, 1, sharex=True)
         ax2[0].plot(
             x_axis,
-            np.array(ts_dict["history"]["pwr_whl_out_watts"]) / 1e6,
+            pwr_whl_out_mw,
             label="tract pwr",
         )
         ax2[0].set_ylabel("Power [MW]")
@@ -410,7 +418,7 @@ def plot_locos_from_ts(ts: alt.SetSpeedTrainSim, x: str, show_plots: bool = Fals
 
         ax2[1].plot(
             x_axis,
-            np.array(ts_dict["history"]["grade_front"]) * 100.0,
+            grade_front_pct,
         )
         ax2[1].set_ylabel("Grade [%] at\nHead End")
 
@@ -418,28 +426,23 @@ def plot_locos_from_ts(ts: alt.SetSpeedTrainSim, x: str, show_plots: bool = Fals
             x_axis,
             ts_dict["history"]["speed_meters_per_second"],
         )
-        ax2[-1].set_xlabel(x_label)
         ax2[-1].set_ylabel("Speed [m/s]")
 
-        plt.suptitle(plot_title + " " + "Power and Grade Profile")
-        plt.tight_layout()
-        if show_plots:
-            plt.show()
+        ax2[0].set_title("Power and Grade Profile")
 
-        fig3, ax3 = plt.subplots(3, 1, sharex=True)
         ax3[0].plot(
             x_axis,
-            np.array(first_hel["history"]["pwr_out_watts"]) / 1e3,
+            _scaled(first_hel["history"]["pwr_out_watts"], 1e-3),
             label="hybrid tract. pwr.",
         )
         ax3[0].plot(
             x_axis,
-            np.array(
+            _scaled(
                 first_hel["loco_type"]["HybridLoco"]["res"]["history"][
                     "pwr_out_electrical_watts"
-                ]
-            )
-            / 1e3,
+                ],
+                1e-3,
+            ),
             label="hybrid batt. elec. pwr.",
         )
         ax3[0].set_ylabel("Power [kW]")
@@ -466,9 +469,10 @@ def plot_locos_from_ts(ts: alt.SetSpeedTrainSim, x: str, show_plots: bool = Fals
             ts_dict["history"]["speed_meters_per_second"],
         )
         ax3[2].set_ylabel("Speed [m/s]")
-        ax3[2].set_xlabel("Times [s]")
-        plt.suptitle(plot_title + " " + "Hybrid Loco Power and Buffer Profile")
-        plt.tight_layout()
+        ax3[2].set_xlabel(x_label)
+        ax3[0].set_title("Hybrid Loco Power and Buffer Profile")
+        fig.suptitle(plot_title)
+        fig.tight_layout()
         if show_plots:
             plt.show()
 
@@ -476,53 +480,43 @@ def plot_locos_from_ts(ts: alt.SetSpeedTrainSim, x: str, show_plots: bool = Fals
 def plot_train_level_powers(
     ts: alt.SpeedLimitTrainSim, mod_str: str
 ) -> Tuple[plt.Figure, plt.Axes]:
-    ts_dict = ts.to_pydict()
+    hist = ts.history.to_pydict()
+    (
+        t_hr,
+        _,
+        pwr_whl_out_mw,
+        res_aero_kn,
+        res_rolling_kn,
+        res_curve_kn,
+        res_bearing_kn,
+        res_grade_kn,
+        *_,
+    ) = _rescale_history(hist)
     fig, ax = plt.subplots(3, 1, sharex=True)
     plt.suptitle("Train Power " + mod_str)
     ax[0].plot(
-        np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-        np.array(ts_dict["history"]["pwr_whl_out_watts"]) / 1e6,
+        t_hr,
+        pwr_whl_out_mw,
         label="tract pwr",
     )
     ax[0].set_ylabel("Power [MW]")
     ax[0].legend()
 
-    ax[1].plot(
-        np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-        np.array(ts_dict["history"]["res_aero_newtons"]) / 1e3,
-        label="aero",
-    )
-    ax[1].plot(
-        np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-        np.array(ts_dict["history"]["res_rolling_newtons"]) / 1e3,
-        label="rolling",
-    )
-    ax[1].plot(
-        np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-        np.array(ts_dict["history"]["res_curve_newtons"]) / 1e3,
-        label="curve",
-    )
-    ax[1].plot(
-        np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-        np.array(ts_dict["history"]["res_bearing_newtons"]) / 1e3,
-        label="bearing",
-    )
-    ax[1].plot(
-        np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-        np.array(ts_dict["history"]["res_grade_newtons"]) / 1e3,
-        label="grade",
+    _plot_resistances(
+        ax[1],
+        t_hr,
+        (res_aero_kn, res_rolling_kn, res_curve_kn, res_bearing_kn, res_grade_kn),
     )
     ax[1].set_ylabel("Force [MN]")
-    ax[1].legend()
 
     ax[-1].plot(
-        np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-        ts_dict["history"]["speed_meters_per_second"],
+        t_hr,
+        hist["speed_meters_per_second"],
         label="achieved",
     )
     ax[-1].plot(
-        np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-        ts_dict["history"]["speed_limit_meters_per_second"],
+        t_hr,
+        hist["speed_limit_meters_per_second"],
         label="limit",
     )
     ax[-1].set_xlabel("Time [hr]")
@@ -535,34 +529,35 @@ def plot_train_level_powers(
 def plot_train_network_info(
     ts: alt.SpeedLimitTrainSim, mod_str: str
 ) -> Tuple[plt.Figure, plt.Axes]:
-    ts_dict = ts.to_pydict()
+    hist = ts.history.to_pydict()
+    t_hr, *_, offset_in_link_km, offset_km, _ = _rescale_history(hist)
 
     fig, ax = plt.subplots(3, 1, sharex=True)
     plt.suptitle("Train Position in Network " + mod_str)
     ax[0].plot(
-        np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-        np.array(ts_dict["history"]["offset_in_link_meters"]) / 1_000,
+        t_hr,
+        offset_in_link_km,
         label="current link",
     )
     ax[0].plot(
-        np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-        np.array(ts_dict["history"]["offset_meters"]) / 1_000,
+        t_hr,
+        offset_km,
         label="overall",
     )
     ax[0].legend()
     ax[0].set_ylabel("Net Dist. [km]")
 
     ax[1].plot(
-        np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-        ts_dict["history"]["link_idx_front"],
+        t_hr,
+        hist["link_idx_front"],
         linestyle="",
         marker=".",
     )
     ax[1].set_ylabel("Link Idx Front")
 
     ax[-1].plot(
-        np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-        ts_dict["history"]["speed_meters_per_second"],
+        t_hr,
+        hist["speed_meters_per_second"],
     )
     ax[-1].set_xlabel("Time [hr]")
     ax[-1].set_ylabel("Speed [m/s]")
@@ -575,27 +570,28 @@ def plot_train_network_info(
 def plot_consist_pwr(
     ts: alt.SpeedLimitTrainSim, mod_str: str
 ) -> Tuple[plt.Figure, plt.Axes]:
-    ts_dict = ts.to_pydict()
+    hist = ts.history.to_pydict()
+    t_hr, _, pwr_whl_out_mw, *_, grade_front_pct = _rescale_history(hist)
 
     fig, ax = plt.subplots(3, 1, sharex=True)
     plt.suptitle("Loco. Consist " + mod_str)
     ax[0].plot(
-        np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-        np.array(ts_dict["history"]["pwr_whl_out_watts"]) / 1e6,
+        t_hr,
+        pwr_whl_out_mw,
         label="consist tract pwr",
     )
     ax[0].set_ylabel("Power [MW]")
     ax[0].legend()
 
     ax[1].plot(
-        np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-        np.array(ts_dict["history"]["grade_front"]) * 100.0,
+        t_hr,
+        grade_front_pct,
     )
     ax[1].set_ylabel("Grade [%] at\nHead End")
 
     ax[-1].plot(
-        np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-        ts_dict["history"]["speed_meters_per_second"],
+        t_hr,
+        hist["speed_meters_per_second"],
     )
     ax[-1].set_xlabel("Time [hr]")
     ax[-1].set_ylabel("Speed [m/s]")
@@ -618,43 +614,48 @@ def plot_hel_pwr_and_soc(
     ax_idx = 0
     ax[ax_idx].plot(
         ts_dict["history"]["time_seconds"],
-        np.array(hybrid_loco["history"]["pwr_out_watts"]) / 1e3,
+        _scaled(hybrid_loco["history"]["pwr_out_watts"], 1e-3),
         label="tract. pwr.",
     )
     ax[ax_idx].plot(
         ts_dict["history"]["time_seconds"],
-        np.array(
-            hybrid_loco["loco_type"][hel_type]["res"]["history"]["pwr_disch_max_watts"]
-        )
-        / 1e3,
+        _scaled(
+            hybrid_loco["loco_type"][hel_type]["res"]["history"]["pwr_disch_max_watts"],
+            1e-3,
+        ),
         label="batt. max disch. pwr",
     )
     ax[ax_idx].plot(
         ts_dict["history"]["time_seconds"],
-        np.array(
-            hybrid_loco["loco_type"][hel_type]["res"]["history"]["pwr_charge_max_watts"]
-        )
-        / 1e3,
+        _scaled(
+            hybrid_loco["loco_type"][hel_type]["res"]["history"][
+                "pwr_charge_max_watts"
+            ],
+            1e-3,
+        ),
         label="batt. max chrg. pwr",
     )
     ax[ax_idx].plot(
         ts_dict["history"]["time_seconds"],
-        np.array(
+        _scaled(
             hybrid_loco["loco_type"][hel_type]["res"]["history"][
                 "pwr_out_electrical_watts"
-            ]
-        )
-        / 1e3,
+            ],
+            1e-3,
+        ),
         label="batt. elec. pwr.",
     )
-    pwr_gen_elect_out = np.array(
-        hybrid_loco["loco_type"][hel_type]["gen"]["history"]["pwr_elec_prop_out_watts"]
-    ) + np.array(
-        hybrid_loco["loco_type"][hel_type]["gen"]["history"]["pwr_elec_aux_watts"]
+    pwr_gen_elect_out_kw = _scaled(
+        hybrid_loco["loco_type"][hel_type]["gen"]["history"]["pwr_elec_prop_out_watts"],
+        1e-3,
+    )
+    pwr_gen_elect_out_kw += _scaled(
+        hybrid_loco["loco_type"][hel_type]["gen"]["history"]["pwr_elec_aux_watts"],
+        1e-3,
     )
     ax[ax_idx].plot(
         ts_dict["history"]["time_seconds"],
-        pwr_gen_elect_out / 1e3,
+        pwr_gen_elect_out_kw,
         label="gen. elec. pwr.",
     )
     y_max = ax[ax_idx].get_ylim()[1]
@@ -706,33 +707,33 @@ def plot_bel_pwr_and_soc(
     ax_idx = 0
     ax[ax_idx].plot(
         ts_dict["history"]["time_seconds"],
-        np.array(batt_loco["history"]["pwr_out_watts"]) / 1e3,
+        _scaled(batt_loco["history"]["pwr_out_watts"], 1e-3),
         label="tract. pwr.",
     )
     ax[ax_idx].plot(
         ts_dict["history"]["time_seconds"],
-        np.array(
-            batt_loco["loco_type"][bel_type]["res"]["history"]["pwr_disch_max_watts"]
-        )
-        / 1e3,
+        _scaled(
+            batt_loco["loco_type"][bel_type]["res"]["history"]["pwr_disch_max_watts"],
+            1e-3,
+        ),
         label="batt. max disch. pwr",
     )
     ax[ax_idx].plot(
         ts_dict["history"]["time_seconds"],
-        np.array(
-            batt_loco["loco_type"][bel_type]["res"]["history"]["pwr_charge_max_watts"]
-        )
-        / 1e3,
+        _scaled(
+            batt_loco["loco_type"][bel_type]["res"]["history"]["pwr_charge_max_watts"],
+            1e-3,
+        ),
         label="batt. max chrg. pwr",
     )
     ax[ax_idx].plot(
         ts_dict["history"]["time_seconds"],
-        np.array(
+        _scaled(
             batt_loco["loco_type"][bel_type]["res"]["history"][
                 "pwr_out_electrical_watts"
-            ]
-        )
-        / 1e3,
+            ],
+            1e-3,
+        ),
         label="batt. elec. pwr.",
     )
     y_max = ax[ax_idx].get_ylim()[1]
@@ -44,60 +44,65 @@ for target in targets:
 
 # %%
 # Plotting code currently just plots the first year of a multi-year simulation.
-to_plot = scenario_infos[0].sims.to_pydict()
-
-for idx, sim_dict in enumerate(to_plot[:10]):
-    loco0 = next(iter(sim_dict["loco_con"]["loco_vec"]))
-    loco0_type = next(iter(loco0["loco_type"].values()))
-
-    if len(sim_dict["loco_con"]["loco_vec"]) > 1:
-        loco1 = next(iter(sim_dict["loco_con"]["loco_vec"]))
-        loco1_type = next(iter(loco1["loco_type"].values()))
-
-    number_of_plots = 1
-    if "fc" in loco0_type:
-        number_of_plots += 1
-    if "res" in loco1_type:
-        number_of_plots += 1
-    fig, ax = plt.subplots(number_of_plots, 1, sharex=True)
-    fig.suptitle(f"sim #: {idx + 1}")
-    ax_idx = -1
-    if "fc" in loco0_type:
-        ax_idx += 1
-        ax[ax_idx].plot(
-            np.array(sim_dict["history"]["time_seconds"]) / 3_600,
-            np.array(loco0_type["fc"]["history"]["pwr_fuel_watts"]) / 1e6,
-            # label='fuel'
+if SHOW_PLOTS:
+    to_plot = scenario_infos[0].sims.to_pydict()
+
+    for idx, sim_dict in enumerate(to_plot[:10]):
+        loco0 = next(iter(sim_dict["loco_con"]["loco_vec"]))
+        loco0_type = next(iter(loco0["loco_type"].values()))
+
+        if len(sim_dict["loco_con"]["loco_vec"]) > 1:
+            loco1 = next(iter(sim_dict["loco_con"]["loco_vec"]))
+            loco1_type = next(iter(loco1["loco_type"].values()))
+
+        number_of_plots = 1
+        if "fc" in loco0_type:
+            number_of_plots += 1
+        if "res" in loco1_type:
+            number_of_plots += 1
+        fig, ax = plt.subplots(number_of_plots, 1, sharex=True)
+        fig.suptitle(f"sim #: {idx + 1}")
+        ax_idx = -1
+        if "fc" in loco0_type:
+            ax_idx += 1
+            ax[ax_idx].plot(
+                np.asarray(sim_dict["history"]["time_seconds"], dtype=np.float64)
+                / 3_600,
+                np.asarray(
+                    loco0_type["fc"]["history"]["pwr_fuel_watts"], dtype=np.float64
+                )
+                / 1e6,
+                # label='fuel'
+            )
+
+            ax[ax_idx].set_ylabel("Single Loco.\nFuel Power [MW]")
+
+        if "res" in loco1_type:
+            ax_idx += 1
+            ax[ax_idx].plot(
+                np.asarray(sim_dict["history"]["time_seconds"], dtype=np.float64)
+                / 3_600,
+                loco1_type["res"]["history"]["soc"],
+            )
+            ax[ax_idx].set_ylabel("SOC")
+
+        ax[-1].plot(
+            np.asarray(sim_dict["history"]["time_seconds"], dtype=np.float64) / 3_600,
+            sim_dict["history"]["speed_meters_per_second"],
+            label="actual",
         )
-
-        ax[ax_idx].set_ylabel("Single Loco.\nFuel Power [MW]")
-
-    if "res" in loco1_type:
-        ax_idx += 1
-        ax[ax_idx].plot(
-            np.array(sim_dict["history"]["time_seconds"]) / 3_600,
-            loco1_type["res"]["history"]["soc"],
+        ax[-1].plot(
+            np.asarray(sim_dict["history"]["time_seconds"], dtype=np.float64) / 3_600,
+            sim_dict["history"]["speed_limit_meters_per_second"],
+            label="limit",
         )
-        ax[ax_idx].set_ylabel("SOC")
-
-    ax[-1].plot(
-        np.array(sim_dict["history"]["time_seconds"]) / 3_600,
-        sim_dict["history"]["speed_meters_per_second"],
-        label="actual",
-    )
-    ax[-1].plot(
-        np.array(sim_dict["history"]["time_seconds"]) / 3_600,
-        sim_dict["history"]["speed_limit_meters_per_second"],
-        label="limit",
-    )
 
-    ax[-1].legend()
-    ax[-1].set_xlabel("Time [hr]")
-    ax[-1].set_ylabel("Speed [m/s]")
+        ax[-1].legend()
+        ax[-1].set_xlabel("Time [hr]")
+        ax[-1].set_ylabel("Speed [m/s]")
 
-    plt.tight_layout()
+        plt.tight_layout()
 
-    if SHOW_PLOTS:
         plt.show()
 
 
@@ -14,7 +14,7 @@ sns.set_theme()
 
 SHOW_PLOTS = alt.utils.show_plots()
 
-SAVE_INTERVAL = 1
+SAVE_INTERVAL = 1 if SHOW_PLOTS else None
 
 # Build the train config
 rail_vehicle_loaded = alt.RailVehicle.from_file(
@@ -79,80 +79,83 @@ train_sim: alt.SetSpeedTrainSim = tsb.make_set_speed_train_sim(
     save_interval=SAVE_INTERVAL,
 )
 
-train_sim.set_save_interval(1)
+train_sim.set_save_interval(SAVE_INTERVAL)
 t0 = time.perf_counter()
 train_sim.walk()
 t1 = time.perf_counter()
 print(f"Time to simulate: {t1 - t0:.5g}")
 
-ts_dict = train_sim.to_pydict()
-
-# pull out solved locomotive for plotting convenience
-loco0: alt.Locomotive = ts_dict["loco_con"]["loco_vec"][0]
-
-fig, ax = plt.subplots(4, 1, sharex=True, figsize=((8, 6)))
-ax[0].plot(
-    np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-    np.array(ts_dict["history"]["pwr_whl_out_watts"]) / 1e6,
-    label="tract pwr",
-)
-ax[0].set_ylabel("Power [MW]")
-# to accommodate the legend
-ax[0].set_xlim(
-    [
-        ax[0].get_xlim()[0],
-        ax[0].get_xlim()[0] + (ax[1].get_xlim()[1] - ax[1].get_xlim()[0]) * 1.2,
-    ]
-)
-ax[0].legend()
-
-ax[1].plot(
-    np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-    ts_dict["history"]["res_aero_newtons"],
-    label="aero",
-)
-ax[1].plot(
-    np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-    ts_dict["history"]["res_rolling_newtons"],
-    label="rolling",
-)
-ax[1].plot(
-    np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-    ts_dict["history"]["res_curve_newtons"],
-    label="curve",
-)
-ax[1].plot(
-    np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-    ts_dict["history"]["res_bearing_newtons"],
-    label="bearing",
-)
-ax[1].plot(
-    np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-    ts_dict["history"]["res_grade_newtons"],
-    label="grade",
-)
-ax[1].set_ylabel("Force [N]")
-ax[1].legend(loc="right")
-
-ax[-1].plot(
-    np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-    ts_dict["speed_trace"]["speed_meters_per_second"],
-)
-ax[-1].set_xlabel("Time [hr]")
-ax[-1].set_ylabel("Speed [m/s]")
-
-ax[2].plot(
-    np.array(ts_dict["history"]["time_seconds"]) / 3_600,
-    np.array(next(iter(loco0["loco_type"].values()))["res"]["history"]["soc"]),
-)
-
-ax[2].set_ylabel("SOC")
-
-plt.suptitle("Set Speed Train Sim Demo")
-plt.tight_layout()
-
 print("SHOW_PLOTS: ", SHOW_PLOTS)
 if SHOW_PLOTS:
+    ts_dict = train_sim.to_pydict()
+
+    # pull out solved locomotive for plotting convenience
+    loco0: alt.Locomotive = ts_dict["loco_con"]["loco_vec"][0]
+
+    fig, ax = plt.subplots(4, 1, sharex=True, figsize=((8, 6)))
+    ax[0].plot(
+        np.asarray(ts_dict["history"]["time_seconds"], dtype=np.float64) / 3_600,
+        np.asarray(ts_dict["history"]["pwr_whl_out_watts"], dtype=np.float64) / 1e6,
+        label="tract pwr",
+    )
+    ax[0].set_ylabel("Power [MW]")
+    # to accommodate the legend
+    ax[0].set_xlim(
+        [
+            ax[0].get_xlim()[0],
+            ax[0].get_xlim()[0] + (ax[1].get_xlim()[1] - ax[1].get_xlim()[0]) * 1.2,
+        ]
+    )
+    ax[0].legend()
+
+    ax[1].plot(
+        np.asarray(ts_dict["history"]["time_seconds"], dtype=np.float64) / 3_600,
+        ts_dict["history"]["res_aero_newtons"],
+        label="aero",
+    )
+    ax[1].plot(
+        np.asarray(ts_dict["history"]["time_seconds"], dtype=np.float64) / 3_600,
+        ts_dict["history"]["res_rolling_newtons"],
+        label="rolling",
+    )
+    ax[1].plot(
+        np.asarray(ts_dict["history"]["time_seconds"], dtype=np.float64) / 3_600,
+        ts_dict["history"]["res_curve_newtons"],
+        label="curve",
+    )
+    ax[1].plot(
+        np.asarray(ts_dict["history"]["time_seconds"], dtype=np.float64) / 3_600,
+        ts_dict["history"]["res_bearing_newtons"],
+        label="bearing",
+    )
+    ax[1].plot(
+        np.asarray(ts_dict["history"]["time_seconds"], dtype=np.float64) / 3_600,
+        ts_dict["history"]["res_grade_newtons"],
+        label="grade",
+    )
+    ax[1].set_ylabel("Force [N]")
+    ax[1].legend(loc="right")
+
+    ax[-1].plot(
+        np.asarray(ts_dict["history"]["time_seconds"], dtype=np.float64) / 3_600,
+        ts_dict["speed_trace"]["speed_meters_per_second"],
+    )
+    ax[-1].set_xlabel("Time [hr]")
+    ax[-1].set_ylabel("Speed [m/s]")
+
+    ax[2].plot(
+        np.asarray(ts_dict["history"]["time_seconds"], dtype=np.float64) / 3_600,
+        np.asarray(
+            next(iter(loco0["loco_type"].values()))["res"]["history"]["soc"],
+            dtype=np.float64,
+        ),
+    )
+
+    ax[2].set_ylabel("SOC")
+
+    plt.suptitle("Set Speed Train Sim Demo")
+    plt.tight_layout()
+
     plt.show()
 
 # %%
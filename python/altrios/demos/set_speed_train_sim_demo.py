@@ -14,10 +14,10 @@ SAVE_INTERVAL = 1
 
 
 # Build the train config
-rail_vehicle_loaded = alt.RailVehicle.from_file(
+rail_vehicle_loaded = alt.RailVehicle.from_file_cached(
     alt.resources_root() / "rolling_stock/Manifest_Loaded.yaml"
 )
-rail_vehicle_empty = alt.RailVehicle.from_file(
+rail_vehicle_empty = alt.RailVehicle.from_file_cached(
     alt.resources_root() / "rolling_stock/Manifest_Empty.yaml"
 )
 
@@ -35,7 +35,7 @@ train_config = alt.TrainConfig(
 # Build the locomotive consist model
 # instantiate battery model
 # https://docs.rs/altrios-core/latest/altrios_core/consist/locomotive/powertrain/reversible_energy_storage/struct.ReversibleEnergyStorage.html#
-res = alt.ReversibleEnergyStorage.from_file(
+res = alt.ReversibleEnergyStorage.from_file_cached(
     alt.resources_root()
     / "powertrains/reversible_energy_storages/Kokam_NMC_75Ah_flx_drive.yaml"
 )
@@ -82,14 +82,17 @@ tsb = alt.TrainSimBuilder(
 )
 
 # Load the network and link path through the network.
-network = alt.Network.from_file(
+network = alt.Network.from_file_cached(
     alt.resources_root() / "networks/Taconite-NoBalloon.yaml"
 )
-link_path = alt.LinkPath.from_csv_file(alt.resources_root() / "demo_data/link_path.csv")
+# msgpack copies of the csv files are loaded because they skip text parsing
+link_path = alt.LinkPath.from_file_cached(
+    alt.resources_root() / "demo_data/link_path.msgpack"
+)
 
 # load the prescribed speed trace that the train will follow
-speed_trace = alt.SpeedTrace.from_csv_file(
-    alt.resources_root() / "demo_data/speed_trace.csv"
+speed_trace = alt.SpeedTrace.from_file_cached(
+    alt.resources_root() / "demo_data/speed_trace.msgpack"
 )
 
 train_sim: alt.SetSpeedTrainSim = tsb.make_set_speed_train_sim(
@@ -107,7 +110,8 @@ print(f"Time to simulate: {t1 - t0:.5g}")
 
 df = train_sim.to_dataframe()
 
-plot_util.plot_locos_from_ts(train_sim, "Distance")
+if SHOW_PLOTS:
+    plot_util.plot_locos_from_ts(train_sim, "Distance", show_plots=True)
 
 # whether to run assertions, enabled by default
 ENABLE_ASSERTS = os.environ.get("ENABLE_ASSERTS", "true").lower() == "true"
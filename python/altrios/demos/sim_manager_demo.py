@@ -132,59 +132,64 @@ print(f"Total elapsed time: {time.perf_counter() - t0_total} s")
 
 # %%
 
-for idx, sim_dict in enumerate(sims_list[:10]):
-
-    loco0 = next(iter(sim_dict["loco_con"]["loco_vec"]))
-    loco0_type = next(iter(loco0["loco_type"].values()))
-
-    if len(sim_dict["loco_con"]["loco_vec"]) > 1:
-        loco1 = next(iter(sim_dict["loco_con"]["loco_vec"]))
-        loco1_type = next(iter(loco1["loco_type"].values()))
-        #plt.suptitle(f"sim #: {idx}")
-    number_of_plots = 1
-    if "fc" in loco0_type:
-        number_of_plots += 1
-    if "res" in loco1_type:
-        number_of_plots += 1
-    fig, ax = plt.subplots(number_of_plots, 1, sharex=True)
-    fig.suptitle(f"sim #: {idx + 1}")
-    ax_idx = -1
-    if "fc" in loco0_type:
-        ax_idx += 1
-        ax[ax_idx].plot(
-            np.array(sim_dict["history"]["time_seconds"]) / 3_600,
-            np.array(loco0_type["fc"]["history"]["pwr_fuel_watts"]) / 1e6,
-            # label='fuel'
+if SHOW_PLOTS:
+    for idx, sim_dict in enumerate(sims_list[:10]):
+
+        loco0 = next(iter(sim_dict["loco_con"]["loco_vec"]))
+        loco0_type = next(iter(loco0["loco_type"].values()))
+
+        if len(sim_dict["loco_con"]["loco_vec"]) > 1:
+            loco1 = next(iter(sim_dict["loco_con"]["loco_vec"]))
+            loco1_type = next(iter(loco1["loco_type"].values()))
+            #plt.suptitle(f"sim #: {idx}")
+        number_of_plots = 1
+        if "fc" in loco0_type:
+            number_of_plots += 1
+        if "res" in loco1_type:
+            number_of_plots += 1
+        fig, ax = plt.subplots(number_of_plots, 1, sharex=True)
+        fig.suptitle(f"sim #: {idx + 1}")
+        ax_idx = -1
+        if "fc" in loco0_type:
+            ax_idx += 1
+            ax[ax_idx].plot(
+                np.asarray(sim_dict["history"]["time_seconds"], dtype=np.float64)
+                / 3_600,
+                np.asarray(
+                    loco0_type["fc"]["history"]["pwr_fuel_watts"], dtype=np.float64
+                )
+                / 1e6,
+                # label='fuel'
+            )
+
+            ax[ax_idx].set_ylabel("Single Loco.\nFuel Power [MW]")
+
+        if "res" in loco1_type:
+            ax_idx += 1
+            ax[ax_idx].plot(
+                np.asarray(sim_dict["history"]["time_seconds"], dtype=np.float64)
+                / 3_600,
+                loco1_type["res"]["history"]["soc"],
+            )
+            ax[ax_idx].set_ylabel("SOC")
+
+        ax[-1].plot(
+            np.asarray(sim_dict["history"]["time_seconds"], dtype=np.float64) / 3_600,
+            sim_dict["history"]["speed_meters_per_second"],
+            label="actual",
+        )
+        ax[-1].plot(
+            np.asarray(sim_dict["history"]["time_seconds"], dtype=np.float64) / 3_600,
+            sim_dict["history"]["speed_limit_meters_per_second"],
+            label="limit",
         )
 
-        ax[ax_idx].set_ylabel("Single Loco.\nFuel Power [MW]")
+        ax[-1].legend()
+        ax[-1].set_xlabel("Time [hr]")
+        ax[-1].set_ylabel("Speed [m/s]")
+
+        fig.tight_layout()
 
-    if "res" in loco1_type:
-        ax_idx += 1
-        ax[ax_idx].plot(
-            np.array(sim_dict["history"]["time_seconds"]) / 3_600,
-            loco1_type["res"]["history"]["soc"],
-        )
-        ax[ax_idx].set_ylabel("SOC")
-
-    ax[-1].plot(
-        np.array(sim_dict["history"]["time_seconds"]) / 3_600,
-        sim_dict["history"]["speed_meters_per_second"],
-        label="actual",
-    )
-    ax[-1].plot(
-        np.array(sim_dict["history"]["time_seconds"]) / 3_600,
-        sim_dict["history"]["speed_limit_meters_per_second"],
-        label="limit",
-    )
-
-    ax[-1].legend()
-    ax[-1].set_xlabel("Time [hr]")
-    ax[-1].set_ylabel("Speed [m/s]")
-
-    fig.tight_layout()
-
-    if SHOW_PLOTS:
         plt.show()
 
 
@@ -67,11 +67,8 @@ bel: alt.Locomotive = alt.Locomotive.from_pydict(
 
 hel: alt.Locomotive = alt.Locomotive.default_hybrid_electric_loco()
 
-# construct a vector of one BEL and several conventional locomotives
-loco_vec = [bel.copy()] + [hel.copy()] + [alt.Locomotive.default()] * 7
-
-# instantiate consist
-loco_con = alt.Consist(loco_vec)
+# instantiate consist of one BEL, one HEL, and several conventional locomotives
+loco_con = alt.Consist.from_locos_and_n_default([bel.copy(), hel.copy()], 7)
 
 # Instantiate the intermediate `TrainSimBuilder`
 tsb = alt.TrainSimBuilder(
@@ -115,15 +112,15 @@ print(f"Time to simulate: {t1 - t0:.5g}")
 ts_dict = train_sim.to_pydict()
 assert len(ts_dict["history"]) > 1
 
-# pull out solved locomotive for plotting convenience
-loco0: alt.Locomotive = next(iter(ts_dict["loco_con"]["loco_vec"]))
-loco0_type = next(iter(loco0["loco_type"].values()))
+if SHOW_PLOTS:
+    # pull out solved locomotive for plotting convenience
+    loco0: alt.Locomotive = next(iter(ts_dict["loco_con"]["loco_vec"]))
+    loco0_type = next(iter(loco0["loco_type"].values()))
 
-fig0, ax0 = plot_util.plot_train_level_powers(train_sim, "With Buffers")
-fig1, ax1 = plot_util.plot_train_network_info(train_sim, "With Buffers")
-fig2, ax2 = plot_util.plot_consist_pwr(train_sim, "With Buffers")
-fig3, ax3 = plot_util.plot_hel_pwr_and_soc(train_sim, "With Buffers")
-fig4, ax4 = plot_util.plot_bel_pwr_and_soc(train_sim, "With Buffers")
+    fig0, ax0 = plot_util.plot_train_level_powers(train_sim, "With Buffers")
+    fig1, ax1 = plot_util.plot_train_network_info(train_sim, "With Buffers")
+    fig2, ax2 = plot_util.plot_consist_pwr(train_sim, "With Buffers")
+    fig3, ax3 = plot_util.plot_hel_pwr_and_soc(train_sim, "With Buffers")
+    fig4, ax4 = plot_util.plot_bel_pwr_and_soc(train_sim, "With Buffers")
 
-if SHOW_PLOTS:
     plt.show()
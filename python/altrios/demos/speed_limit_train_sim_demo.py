@@ -17,10 +17,10 @@ SAVE_INTERVAL = 1
 
 # Build the train config
 print("Loading rail vehicles")
-rail_vehicle_loaded = alt.RailVehicle.from_file(
+rail_vehicle_loaded = alt.RailVehicle.from_file_cached(
     alt.resources_root() / "rolling_stock/Manifest_Loaded.yaml"
 )
-rail_vehicle_empty = alt.RailVehicle.from_file(
+rail_vehicle_empty = alt.RailVehicle.from_file_cached(
     alt.resources_root() / "rolling_stock/Manifest_Empty.yaml"
 )
 
@@ -39,7 +39,7 @@ train_config = alt.TrainConfig(
 # Build the locomotive consist model
 # instantiate battery model
 # https://docs.rs/altrios-core/latest/altrios_core/consist/locomotive/powertrain/reversible_energy_storage/struct.ReversibleEnergyStorage.html#
-res = alt.ReversibleEnergyStorage.from_file(
+res = alt.ReversibleEnergyStorage.from_file_cached(
     alt.resources_root()
     / "powertrains/reversible_energy_storages/Kokam_NMC_75Ah_flx_drive.yaml"
 )
@@ -146,7 +146,7 @@ tsb_sans_buffers = alt.TrainSimBuilder(
 
 # Load the network and construct the timed link path through the network.
 print("Loading `Network`")
-network = alt.Network.from_file(
+network = alt.Network.from_file_cached(
     alt.resources_root() / "networks/Taconite-NoBalloon.yaml"
 )
 
@@ -205,8 +205,9 @@ timed_link_path_sans_buffers = next(
 OVERRIDE_SSTS_INPUTS = os.environ.get("OVERRIDE_SSTS_INPUTS", "false").lower() == "true"
 if OVERRIDE_SSTS_INPUTS:
     print("Overriding files used by `set_speed_train_sim_demo.py`")
-    link_path = alt.LinkPath([x.link_idx for x in timed_link_path.tolist()])
+    link_path = timed_link_path.to_link_path()
     link_path.to_csv_file(alt.resources_root() / "demo_data/link_path.csv")
+    link_path.to_file(alt.resources_root() / "demo_data/link_path.msgpack")
 
 t0 = time.perf_counter()
 print("Running `walk_timed_path`")
@@ -271,26 +272,27 @@ if OVERRIDE_SSTS_INPUTS:
         ts_dict["history"]["speed_meters_per_second"],
     )
     speed_trace.to_csv_file(alt.resources_root() / "demo_data/speed_trace.csv")
+    speed_trace.to_file(alt.resources_root() / "demo_data/speed_trace.msgpack")
 
-fig0, ax0 = plot_util.plot_train_level_powers(train_sim, "With Buffers")
-fig1, ax1 = plot_util.plot_train_network_info(train_sim, "With Buffers")
-fig2, ax2 = plot_util.plot_consist_pwr(train_sim, "With Buffers")
-fig3, ax3 = plot_util.plot_hel_pwr_and_soc(train_sim, "With Buffers")
+if SHOW_PLOTS:
+    fig0, ax0 = plot_util.plot_train_level_powers(train_sim, "With Buffers")
+    fig1, ax1 = plot_util.plot_train_network_info(train_sim, "With Buffers")
+    fig2, ax2 = plot_util.plot_consist_pwr(train_sim, "With Buffers")
+    fig3, ax3 = plot_util.plot_hel_pwr_and_soc(train_sim, "With Buffers")
 
-fig0_sans_buffers, ax0_sans_buffers = plot_util.plot_train_level_powers(
-    train_sim_sans_buffers, "Without Buffers"
-)
-fig1_sans_buffers, ax1_sans_buffers = plot_util.plot_train_network_info(
-    train_sim_sans_buffers, "Without Buffers"
-)
-fig2_sans_buffers, ax2_sans_buffers = plot_util.plot_consist_pwr(
-    train_sim_sans_buffers, "Without Buffers"
-)
-fig3_sans_buffers, ax3_sans_buffers = plot_util.plot_hel_pwr_and_soc(
-    train_sim_sans_buffers, "Without Buffers"
-)
+    fig0_sans_buffers, ax0_sans_buffers = plot_util.plot_train_level_powers(
+        train_sim_sans_buffers, "Without Buffers"
+    )
+    fig1_sans_buffers, ax1_sans_buffers = plot_util.plot_train_network_info(
+        train_sim_sans_buffers, "Without Buffers"
+    )
+    fig2_sans_buffers, ax2_sans_buffers = plot_util.plot_consist_pwr(
+        train_sim_sans_buffers, "Without Buffers"
+    )
+    fig3_sans_buffers, ax3_sans_buffers = plot_util.plot_hel_pwr_and_soc(
+        train_sim_sans_buffers, "Without Buffers"
+    )
 
-if SHOW_PLOTS:
     plt.tight_layout()
     plt.show()
 # Impact of sweep of battery capacity TODO: make this happen
@@ -161,8 +161,9 @@ timed_link_path_with_derating = next(
 OVERRIDE_SSTS_INPUTS = os.environ.get("OVERRIDE_SSTS_INPUTS", "false").lower() == "true"
 if OVERRIDE_SSTS_INPUTS:
     print("Overriding files used by `set_speed_train_sim_demo.py`")
-    link_path = alt.LinkPath([x.link_idx for x in timed_link_path.tolist()])
+    link_path = timed_link_path.to_link_path()
     link_path.to_csv_file(alt.resources_root() / "demo_data/link_path.csv")
+    link_path.to_file(alt.resources_root() / "demo_data/link_path.msgpack")
 
 t0 = time.perf_counter()
 train_sim.walk_timed_path(
@@ -225,71 +226,71 @@ print(
     f"SOC-corrected fuel increase due to derating: {fuel_increase_soc_corrected:.5g}%"
 )
 
-df_no_derate = train_sim.to_dataframe()
-df_with_derate = train_sim_with_derating.to_dataframe()
+if SHOW_PLOTS:
+    df_no_derate = train_sim.to_dataframe()
+    df_with_derate = train_sim_with_derating.to_dataframe()
+
+    fig, ax = plt.subplots(3, 1, sharex=True)
+    fig.suptitle("Derate Comparison")
+    ax[0].plot(
+        df_no_derate["history.time_seconds"],
+        df_no_derate["loco_con.history.energy_fuel_joules"] / 1e9,
+        label="no derating",
+    )
+    ax[0].plot(
+        df_with_derate["history.time_seconds"],
+        df_with_derate["loco_con.history.energy_fuel_joules"] / 1e9,
+        label="with derate",
+    )
+    ax[0].legend()
+    ax[0].set_ylabel("Cumulative Fuel [GJ]")
 
-fig, ax = plt.subplots(3, 1, sharex=True)
-fig.suptitle("Derate Comparison")
-ax[0].plot(
-    df_no_derate["history.time_seconds"],
-    df_no_derate["loco_con.history.energy_fuel_joules"] / 1e9,
-    label="no derating",
-)
-ax[0].plot(
-    df_with_derate["history.time_seconds"],
-    df_with_derate["loco_con.history.energy_fuel_joules"] / 1e9,
-    label="with derate",
-)
-ax[0].legend()
-ax[0].set_ylabel("Cumulative Fuel [GJ]")
+    ax[1].plot(
+        df_no_derate["history.time_seconds"],
+        df_no_derate["loco_con.history.pwr_out_max_watts"] / 1e6,
+        label="no derating pwr max",
+    )
+    ax[1].plot(
+        df_with_derate["history.time_seconds"],
+        df_with_derate["loco_con.history.pwr_out_max_watts"] / 1e6,
+        label="with derate pwr max",
+    )
+    ax[1].legend()
+    ax[1].set_ylabel("Engine Power [MW]")
 
-ax[1].plot(
-    df_no_derate["history.time_seconds"],
-    df_no_derate["loco_con.history.pwr_out_max_watts"] / 1e6,
-    label="no derating pwr max",
-)
-ax[1].plot(
-    df_with_derate["history.time_seconds"],
-    df_with_derate["loco_con.history.pwr_out_max_watts"] / 1e6,
-    label="with derate pwr max",
-)
-ax[1].legend()
-ax[1].set_ylabel("Engine Power [MW]")
+    ax[2].plot(
+        df_no_derate["history.time_seconds"],
+        df_no_derate["history.speed_meters_per_second"],
+        label="no derating",
+    )
+    ax[2].plot(
+        df_with_derate["history.time_seconds"],
+        df_with_derate["history.speed_meters_per_second"],
+        label="with derate",
+    )
+    ax[2].legend()
+    ax[2].set_ylabel("Speed [m/s]")
+    ax[2].set_xlabel("Times [s]")
+    plt.tight_layout()
 
-ax[2].plot(
-    df_no_derate["history.time_seconds"],
-    df_no_derate["history.speed_meters_per_second"],
-    label="no derating",
-)
-ax[2].plot(
-    df_with_derate["history.time_seconds"],
-    df_with_derate["history.speed_meters_per_second"],
-    label="with derate",
-)
-ax[2].legend()
-ax[2].set_ylabel("Speed [m/s]")
-ax[2].set_xlabel("Times [s]")
-plt.tight_layout()
-
-fig0, ax0 = plot_util.plot_train_level_powers(train_sim, "No Derating")
-fig1, ax1 = plot_util.plot_train_network_info(train_sim, "No Derating")
-fig2, ax2 = plot_util.plot_consist_pwr(train_sim, "No Derating")
-fig3, ax3 = plot_util.plot_hel_pwr_and_soc(train_sim, "No Derating")
-
-fig0_sans_buffers, ax0_sans_buffers = plot_util.plot_train_level_powers(
-    train_sim_with_derating, "With Altitude and Temperature Derating"
-)
-fig1_sans_buffers, ax1_sans_buffers = plot_util.plot_train_network_info(
-    train_sim_with_derating, "With Altitude and Temperature Derating"
-)
-fig2_sans_buffers, ax2_sans_buffers = plot_util.plot_consist_pwr(
-    train_sim_with_derating, "With Altitude and Temperature Derating"
-)
-fig3_sans_buffers, ax3_sans_buffers = plot_util.plot_hel_pwr_and_soc(
-    train_sim_with_derating, "With Altitude and Temperature Derating"
-)
+    fig0, ax0 = plot_util.plot_train_level_powers(train_sim, "No Derating")
+    fig1, ax1 = plot_util.plot_train_network_info(train_sim, "No Derating")
+    fig2, ax2 = plot_util.plot_consist_pwr(train_sim, "No Derating")
+    fig3, ax3 = plot_util.plot_hel_pwr_and_soc(train_sim, "No Derating")
+
+    fig0_sans_buffers, ax0_sans_buffers = plot_util.plot_train_level_powers(
+        train_sim_with_derating, "With Altitude and Temperature Derating"
+    )
+    fig1_sans_buffers, ax1_sans_buffers = plot_util.plot_train_network_info(
+        train_sim_with_derating, "With Altitude and Temperature Derating"
+    )
+    fig2_sans_buffers, ax2_sans_buffers = plot_util.plot_consist_pwr(
+        train_sim_with_derating, "With Altitude and Temperature Derating"
+    )
+    fig3_sans_buffers, ax3_sans_buffers = plot_util.plot_hel_pwr_and_soc(
+        train_sim_with_derating, "With Altitude and Temperature Derating"
+    )
 
-if SHOW_PLOTS:
     plt.tight_layout()
     plt.show()
 # Impact of sweep of battery capacity TODO: make this happen
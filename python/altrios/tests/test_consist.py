@@ -1 +1,14 @@
+import unittest
 
+import altrios as alt
+from .mock_resources import mock_battery_electric_locomotive
+
+
+class TestConsist(unittest.TestCase):
+    def test_from_locos_and_n_default(self):
+        bel = mock_battery_electric_locomotive()
+
+        consist = alt.Consist.from_locos_and_n_default([bel], 7)
+        consist_ref = alt.Consist([bel] + [alt.Locomotive.default()] * 7)
+
+        assert consist.to_pydict() == consist_ref.to_pydict()
@@ -14,3 +14,13 @@ class TestLocomotiveSimulation(unittest.TestCase):
         mock_sim = mock_locomotive_simulation(save_interval=1)
 
         mock_sim.walk()
+
+    def test_walk_save_interval_zero_or_none(self):
+        for save_interval in (0, None):
+            with self.subTest(save_interval=save_interval):
+                mock_sim = mock_locomotive_simulation(save_interval=save_interval)
+
+                mock_sim.walk()
+
+                assert len(mock_sim.loco_unit.history) == 0
+                assert len(mock_sim.loco_unit.fc.history) == 0
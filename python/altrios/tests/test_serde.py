@@ -1,7 +1,13 @@
+import os
+import shutil
 import time
+import polars as pl
 import altrios as alt
 
 SAVE_INTERVAL = 100
+FUEL_CONVERTER_FILE = (
+    alt.resources_root() / "powertrains/fuel_converters/wabtec_tier4.yaml"
+)
 
 
 def get_solved_speed_limit_train_sim():
@@ -132,5 +138,56 @@ def test_pydict():
     assert ts_yaml.to_pydict() == ts.to_pydict()
 
 
+def test_from_file_cached_hit():
+    fc = alt.FuelConverter.from_file_cached(FUEL_CONVERTER_FILE)
+    hits = alt._cached_from_file.cache_info().hits
+    fc_cached = alt.FuelConverter.from_file_cached(FUEL_CONVERTER_FILE)
+
+    assert alt._cached_from_file.cache_info().hits == hits + 1
+    assert fc_cached.to_pydict() == fc.to_pydict()
+    assert (
+        fc.to_pydict() == alt.FuelConverter.from_file(FUEL_CONVERTER_FILE).to_pydict()
+    )
+
+
+def test_from_file_cached_reloads_on_mtime_change(tmp_path):
+    fc_file = tmp_path / FUEL_CONVERTER_FILE.name
+    shutil.copy(FUEL_CONVERTER_FILE, fc_file)
+    fc = alt.FuelConverter.from_file_cached(fc_file)
+
+    fc_file.write_text(
+        fc_file.read_text().replace(
+            "pwr_out_max_watts: 3.356e6", "pwr_out_max_watts: 2.0e6"
+        )
+    )
+    # bump the mtime explicitly in case the edit lands within the mtime resolution
+    mtime_ns = fc_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(fc_file, ns=(mtime_ns, mtime_ns))
+    fc_edited = alt.FuelConverter.from_file_cached(fc_file)
+
+    assert fc.pwr_out_max_watts == 3.356e6
+    assert fc_edited.pwr_out_max_watts == 2.0e6
+
+
+def test_from_file_cached_returns_copy():
+    fc = alt.FuelConverter.from_file_cached(FUEL_CONVERTER_FILE)
+    fc_dict = fc.to_pydict()
+    fc.set_default_elev_and_temp_derate()
+    assert fc.to_pydict() != fc_dict
+
+    assert (
+        alt.FuelConverter.from_file_cached(FUEL_CONVERTER_FILE).to_pydict() == fc_dict
+    )
+
+
+def test_link_path_from_indices():
+    link_path_file = alt.resources_root() / "demo_data/link_path.csv"
+    link_path = alt.LinkPath.from_csv_file(link_path_file)
+
+    idxs = pl.read_csv(link_path_file).get_column("link_idx").to_list()
+
+    assert alt.LinkPath.from_indices(idxs).to_json() == link_path.to_json()
+
+
 if __name__ == "__main__":
     test_pydict()
@@ -1,12 +1,178 @@
 import unittest
 
+import polars as pl
 
-from altrios.train_planner import planner
+import altrios as alt
+from altrios import defaults
+from altrios.train_planner import data_prep, planner_config, train_demand_generators
+
+DEMAND_TRAINS_COLUMNS = [
+    "Origin",
+    "Destination",
+    "Train_Type",
+    "Number_of_Cars_Loaded",
+    "Number_of_Cars_Empty",
+    "Tons_Per_Car_Loaded",
+    "Tons_Per_Car_Empty",
+    "HP_Required_Per_Ton_Loaded",
+    "HP_Required_Per_Ton_Empty",
+    "Number_of_Cars",
+    "Cars_Per_Train_Min",
+    "Cars_Per_Train_Target",
+    "Number_of_Trains",
+    "Number_of_Containers_Loaded",
+    "Number_of_Containers_Empty",
+    "Number_of_Days",
+]
+
+
+def get_config() -> planner_config.TrainPlannerConfig:
+    config = planner_config.TrainPlannerConfig()
+    config.return_demand_generators = (
+        train_demand_generators.get_default_return_demand_generators()
+    )
+    return config
 
 
 class TestTrainPlanner(unittest.TestCase):
-    def populate_me(self):
-        """
-        to be populated with an actual test and renamed accordingly
-        """
-        pass
+    def test_generate_demand_trains(self):
+        config = get_config()
+        rail_vehicles = [
+            alt.RailVehicle.from_file(vehicle_file)
+            for vehicle_file in sorted(
+                (alt.resources_root() / "rolling_stock").glob("*.yaml")
+            )
+        ]
+        freight_type_to_car_type = {
+            rv.to_pydict()["freight_type"]: rv.to_pydict()["car_type"]
+            for rv in rail_vehicles
+        }
+        demand, node_list = data_prep.load_freight_demand(defaults.DEMAND_FILE, config)
+        # `Number_of_Days` matches `simulation_days` and intermodal containers are
+        # exactly two per car, so this is the demand the planner aggregates to
+        demand = demand.select("Origin", "Destination", "Train_Type", "Number_of_Cars")
+
+        demand_returns = train_demand_generators.generate_return_demand(demand, config)
+        demand_rebalancing = (
+            train_demand_generators.generate_manifest_rebalancing_demand(
+                demand, node_list, config
+            )
+        )
+        demand_trains = train_demand_generators.generate_demand_trains(
+            demand,
+            demand_returns,
+            demand_rebalancing,
+            rail_vehicles,
+            freight_type_to_car_type,
+            config,
+        )
+
+        assert demand_trains.columns == DEMAND_TRAINS_COLUMNS
+        assert demand_trains.schema["Number_of_Trains"] == pl.UInt32
+        assert demand_trains.schema["Number_of_Days"] == pl.Int32
+        assert all(
+            demand_trains.schema[col] == pl.Float64
+            for col in DEMAND_TRAINS_COLUMNS[3:12] + DEMAND_TRAINS_COLUMNS[13:15]
+        )
+        assert demand_trains.height == 6
+        assert demand_trains.get_column("Number_of_Cars_Loaded").sum() == 4961
+        assert demand_trains.get_column("Number_of_Cars_Empty").sum() == 2855
+        assert demand_trains.get_column("Number_of_Cars").sum() == 7816
+        assert demand_trains.get_column("Number_of_Trains").sum() == 46
+
+    def test_build_locopool_tile(self):
+        config = get_config()
+        loco_pool = data_prep.build_locopool(config, defaults.DEMAND_FILE)
+
+        assert loco_pool.columns[:12] == [
+            "Locomotive_ID",
+            "Locomotive_Type",
+            "Node",
+            "Arrival_Time",
+            "Servicing_Done_Time",
+            "Refueling_Done_Time",
+            "Status",
+            "SOC_Target_J",
+            "Refuel_Duration",
+            "Refueler_J_Per_Hr",
+            "Refueler_Efficiency",
+            "Port_Count",
+        ]
+        assert loco_pool.schema["Locomotive_ID"] == pl.UInt32
+        assert loco_pool.schema["Locomotive_Type"] == pl.Categorical
+        assert loco_pool.schema["Node"] == pl.Categorical
+        assert loco_pool.schema["Port_Count"] == pl.UInt32
+        assert loco_pool.height == 72
+        assert loco_pool.get_column("Locomotive_ID").n_unique() == 72
+        counts = (
+            loco_pool.group_by(pl.col("Node", "Locomotive_Type").cast(pl.Utf8))
+            .len()
+            .sort("Node", "Locomotive_Type")
+            .rows()
+        )
+        assert counts == [
+            ("Allouez", "BEL", 18),
+            ("Allouez", "Diesel_Large", 18),
+            ("Hibbing", "BEL", 18),
+            ("Hibbing", "Diesel_Large", 18),
+        ]
+
+    def test_build_locopool_shares_twoway(self):
+        config = get_config()
+        loco_pool = data_prep.build_locopool(
+            config,
+            defaults.DEMAND_FILE,
+            method="shares_twoway",
+            shares=[0.25, 0.75],
+            locomotives_per_node=8,
+        )
+
+        assert loco_pool.height == 16
+        counts = (
+            loco_pool.group_by(pl.col("Node", "Locomotive_Type").cast(pl.Utf8))
+            .len()
+            .sort("Node", "Locomotive_Type")
+            .rows()
+        )
+        assert counts == [
+            ("Allouez", "BEL", 6),
+            ("Allouez", "Diesel_Large", 2),
+            ("Hibbing", "BEL", 6),
+            ("Hibbing", "Diesel_Large", 2),
+        ]
+
+    def test_build_refuelers(self):
+        config = get_config()
+        loco_pool = data_prep.build_locopool(config, defaults.DEMAND_FILE)
+        _, node_list = data_prep.load_freight_demand(defaults.DEMAND_FILE, config)
+        refuelers = data_prep.build_refuelers(
+            node_list,
+            loco_pool,
+            config.refueler_info,
+            config.refuelers_per_incoming_corridor,
+        )
+
+        assert list(refuelers.schema.items()) == [
+            ("Node", pl.Categorical),
+            ("Refueler_Type", pl.Categorical),
+            ("Locomotive_Type", pl.Categorical),
+            ("Fuel_Type", pl.Categorical),
+            ("Refueler_J_Per_Hr", pl.Float64),
+            ("Refueler_Efficiency", pl.Float64),
+            ("Lifespan_Years", pl.Float64),
+            ("Cost_USD", pl.Float64),
+            ("Port_Count", pl.UInt32),
+        ]
+        assert refuelers.height == 4
+        assert refuelers.get_column("Node").cast(pl.Utf8).to_list() == [
+            "Allouez",
+            "Allouez",
+            "Hibbing",
+            "Hibbing",
+        ]
+        # half the pool is each type, so each node gets ceil(0.5 * 4) ports per type
+        assert refuelers.get_column("Port_Count").to_list() == [2, 2, 2, 2]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,8 @@ import tempfile
 import unittest
 from pathlib import Path
 
+import numpy as np
+
 from .mock_resources import *
 
 import altrios as alt
@@ -18,3 +20,25 @@ class TestUtilities(unittest.TestCase):
                 lines = file.readlines()
                 assert prepend_str in lines[0]
                 assert len(lines) > 3
+
+    def test_cumutrapz(self):
+        x = np.array([0.0, 1.0, 3.0, 4.5])
+        y = np.array([2.0, 4.0, 0.0, -2.0])
+        z = alt.utils.cumutrapz(x, y)
+        assert np.allclose(z, [0.0, 3.0, 7.0, 5.5])
+
+    def test_smoothen(self):
+        signal = np.random.default_rng(0).normal(size=500).cumsum()
+        for period in (1, 2, 3, 8, 9, 60):
+            with self.subTest(period=period):
+                padded = np.concatenate(
+                    [
+                        np.full(((period + 1) // 2) - 1, signal[0]),
+                        signal,
+                        np.full(period // 2, signal[-1]),
+                    ]
+                )
+                reference = np.convolve(padded, np.ones(period) / period, mode="valid")
+                smoothed = alt.utils.smoothen(signal, period)
+                assert smoothed.shape == signal.shape
+                assert np.allclose(smoothed, reference, rtol=1e-9, atol=1e-9)
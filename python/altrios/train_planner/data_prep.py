@@ -5,12 +5,13 @@ import polars.selectors as cs
 import pandas as pd
 import numpy as np
 import math
-from scipy.stats import rankdata
 import altrios as alt
 from altrios import defaults, utilities
 from altrios.train_planner import planner_config
 
 day_order_map = {"Mon": 1, "Tue": 2, "Wed": 3, "Thu": 4, "Fri": 5, "Sat": 6, "Sun": 7}
+# physical codes of this enum follow `day_order_map`, offset by one
+day_of_week_enum = pl.Enum(list(day_order_map))
 
 
 def convert_demand_to_sim_days(
@@ -40,7 +41,9 @@ def load_freight_demand(
     Load the user input csv file into a dataframe for later processing
     Arguments:
     ----------
-    user_input_file: path to the input csv file that user import to the module
+    user_input_file: path to the input csv file that user import to the module; a
+    `.parquet` (or `.pq`) file with the same columns is read directly, which is
+    faster for demand tables that are loaded repeatedly
     Example Input:
         Origin	Destination	Train_Type	Number_of_Cars	Number_of_Containers
         Barstow	Stockton	Unit	    2394	        0
@@ -54,20 +57,27 @@ def load_freight_demand(
     node_list: List of origin or destination demand nodes
     """
     if isinstance(demand_table, (Path, str)):
-        demand_table = pl.read_csv(demand_table).pipe(
+        demand_path = Path(demand_table)
+        if demand_path.suffix.lower() in (".parquet", ".pq"):
+            demand_table = pl.scan_parquet(demand_path)
+        else:
+            demand_table = pl.scan_csv(demand_path)
+        # scaling is applied in the scan plan so the file is parsed straight into
+        # the converted frame
+        demand_table = demand_table.pipe(
             convert_demand_to_sim_days, simulation_days=config.simulation_days
-        )
+        ).collect()
     elif "Hour" not in demand_table.collect_schema():
         demand_table = demand_table.pipe(
             convert_demand_to_sim_days, simulation_days=config.simulation_days
         )
 
+    # only `Origin` and `Destination` are projected for the node list
     nodes = (
-        pl.concat(
-            [demand_table.get_column("Origin"), demand_table.get_column("Destination")]
-        )
-        .unique()
-        .sort()
+        demand_table.lazy()
+        .select(pl.col("Origin").append(pl.col("Destination")).unique().sort())
+        .collect()
+        .to_series()
     )
     return demand_table, nodes
 
@@ -105,7 +115,11 @@ def prep_hourly_demand(
         total_demand.join(daily_demand_density, how="inner", on=["Terminal_Type"])
         .with_columns(
             (pl.col(demand_col) * pl.col("Share")).alias(f"{demand_col}_Daily"),
-            pl.col("Day_Of_Week").replace_strict(day_order_map).alias("Day_Order"),
+            pl.col("Day_Of_Week")
+            .cast(day_of_week_enum)
+            .to_physical()
+            .add(1)
+            .alias("Day_Order"),
         )
         .pipe(
             utilities.allocateItems,
@@ -161,63 +175,38 @@ def append_loco_info(loco_info: pd.DataFrame) -> pd.DataFrame:
     ):
         return loco_info
 
-    def get_hp(loco: alt.Locomotive):
-        return loco.pwr_rated_kilowatts * 1e3 / alt.utils.W_PER_HP
-
-    def get_mass_ton(loco: alt.Locomotive):
-        loco_dict = loco.to_pydict()
-        if loco_dict["mass_kilograms"] is None:
-            return 0
-        else:
-            return loco_dict["mass_kilograms"] / alt.utils.KG_PER_TON
-
-    def get_starting_soc(loco: alt.Locomotive):
+    w_per_hp = alt.utils.W_PER_HP
+    kg_per_ton = alt.utils.KG_PER_TON
+    diesel_tank_capacity_j = defaults.DIESEL_TANK_CAPACITY_J
+    hp, mass_ton, soc, soc_min, soc_max, capacity = [], [], [], [], [], []
+    # one pass and one `to_pydict` per locomotive fills all six columns
+    for loco in loco_info["Rust_Loco"].tolist():
+        hp.append(loco.pwr_rated_kilowatts * 1e3 / w_per_hp)
         loco_dict = loco.to_pydict()
+        mass_kg = loco_dict["mass_kilograms"]
+        mass_ton.append(0 if mass_kg is None else mass_kg / kg_per_ton)
         loco_type = next(iter(loco_dict["loco_type"].values()))
         if "res" not in loco_type.keys():
-            return defaults.DIESEL_TANK_CAPACITY_J
+            soc.append(diesel_tank_capacity_j)
+            soc_min.append(0)
+            soc_max.append(diesel_tank_capacity_j)
+            capacity.append(diesel_tank_capacity_j)
         else:
-            return (
-                loco_type["res"]["state"]["soc"]
-                * loco_type["res"]["energy_capacity_joules"]
-            )
-
-    def get_min_soc(loco: alt.Locomotive):
-        loco_dict = loco.to_pydict()
-        loco_type = next(iter(loco_dict["loco_type"].values()))
-        if "res" not in loco_type.keys():
-            return 0
-        else:
-            return (
-                loco_type["res"]["min_soc"] * loco_type["res"]["energy_capacity_joules"]
-            )
-
-    def get_max_soc(loco: alt.Locomotive):
-        loco_dict = loco.to_pydict()
-        loco_type = next(iter(loco_dict["loco_type"].values()))
-        if "res" not in loco_type.keys():
-            return defaults.DIESEL_TANK_CAPACITY_J
-        else:
-            return (
-                loco_type["res"]["max_soc"] * loco_type["res"]["energy_capacity_joules"]
-            )
-
-    def get_capacity(loco: alt.Locomotive):
-        loco_dict = loco.to_pydict()
-        loco_type = next(iter(loco_dict["loco_type"].values()))
-        if "res" not in loco_type.keys():
-            return defaults.DIESEL_TANK_CAPACITY_J
-        else:
-            return loco_type["res"]["energy_capacity_joules"]
-
-    loco_info.loc[:, "HP"] = loco_info.loc[:, "Rust_Loco"].apply(get_hp)
-    loco_info.loc[:, "Loco_Mass_Tons"] = loco_info.loc[:, "Rust_Loco"].apply(
-        get_mass_ton
+            res = loco_type["res"]
+            res_capacity = res["energy_capacity_joules"]
+            soc.append(res["state"]["soc"] * res_capacity)
+            soc_min.append(res["min_soc"] * res_capacity)
+            soc_max.append(res["max_soc"] * res_capacity)
+            capacity.append(res_capacity)
+
+    loco_info = loco_info.assign(
+        HP=hp,
+        Loco_Mass_Tons=mass_ton,
+        SOC_J=soc,
+        SOC_Min_J=soc_min,
+        SOC_Max_J=soc_max,
+        Capacity_J=capacity,
     )
-    loco_info.loc[:, "SOC_J"] = loco_info.loc[:, "Rust_Loco"].apply(get_starting_soc)
-    loco_info.loc[:, "SOC_Min_J"] = loco_info.loc[:, "Rust_Loco"].apply(get_min_soc)
-    loco_info.loc[:, "SOC_Max_J"] = loco_info.loc[:, "Rust_Loco"].apply(get_max_soc)
-    loco_info.loc[:, "Capacity_J"] = loco_info.loc[:, "Rust_Loco"].apply(get_capacity)
     return loco_info
 
 
@@ -247,23 +236,19 @@ def build_locopool(
 
     num_nodes = len(node_list)
     if locomotives_per_node is None:
-        num_ods = demand.select("Origin", "Destination").unique().height
         if "Number_of_Cars" in demand.collect_schema():
-            cars_per_od = (
-                demand.group_by("Origin", "Destination")
-                .agg(pl.col("Number_of_Cars").sum())
-                .get_column("Number_of_Cars")
-                .mean()
-            )
+            cars_expr = pl.col("Number_of_Cars").sum()
         elif "Number_of_Containers" in demand.collect_schema():
-            cars_per_od = (
-                demand.group_by("Origin", "Destination")
-                .agg(pl.col("Number_of_Containers").sum())
-                .get_column("Number_of_Containers")
-                .mean()
-            ) / config.containers_per_car
+            cars_expr = pl.col("Number_of_Containers").sum() / config.containers_per_car
         else:
             assert "No valid columns in demand DataFrame"
+        # OD count and mean cars per OD come from the same grouping
+        num_ods, cars_per_od = (
+            demand.group_by("Origin", "Destination")
+            .agg(cars_expr.alias("Cars_Per_OD"))
+            .select(pl.len(), pl.col("Cars_Per_OD").mean())
+            .row(0)
+        )
         if config.single_train_mode:
             initial_size = math.ceil(
                 cars_per_od / min(config.cars_per_locomotive.values())
@@ -315,19 +300,18 @@ def build_locopool(
         rows = locomotives_per_node * num_nodes
 
     if config.single_train_mode:
-        sorted_nodes = np.tile(
-            [demand.select(pl.col("Origin").first()).item()], rows
-        ).tolist()
-        engine_numbers = range(0, rows)
+        sorted_nodes = np.tile([demand.select(pl.col("Origin").first()).item()], rows)
+        engine_numbers = np.arange(rows, dtype=np.uint32)
     else:
-        sorted_nodes = np.sort(np.tile(node_list, initial_size)).tolist()
-        engine_numbers = rankdata(sorted_nodes, method="dense") * 1000 + np.tile(
-            range(0, initial_size), num_nodes
-        )
+        # `node_list` is unique and sorted, so each node's dense rank is its position
+        sorted_nodes = np.repeat(node_list.to_numpy(), initial_size)
+        engine_numbers = np.repeat(
+            np.arange(1, num_nodes + 1, dtype=np.uint32), initial_size
+        ) * 1000 + np.tile(np.arange(initial_size, dtype=np.uint32), num_nodes)
 
     if method == "tile":
         repetitions = math.ceil(rows / len(loco_types))
-        types = np.tile(loco_types, repetitions).tolist()[0:rows]
+        types = np.tile(loco_types, repetitions)[0:rows]
     elif method == "shares_twoway":
         # TODO: this logic can be replaced (and generalized to >2 types) using altrios.utilities.allocateItems
         if (len(loco_types) != 2) | (len(shares) != 2):
@@ -338,34 +322,32 @@ def build_locopool(
         idx_1 = np.argmin(shares)
         idx_2 = 1 - idx_1
         share_type_one = shares[idx_1]
-        label_type_one = loco_types[idx_1]
-        label_type_two = loco_types[idx_2]
 
+        # build the per-node pattern as integer indices into `loco_types`
         num_type_one = round(initial_size * share_type_one)
         if 0 == num_type_one:
-            types = pd.Series([label_type_two] * initial_size)
+            codes = np.full(initial_size, idx_2)
         elif initial_size == num_type_one:
-            types = pd.Series([label_type_one] * initial_size)
+            codes = np.full(initial_size, idx_1)
         else:
             # Arrange repeated sequences of type 1 + {type_two_per_type_one, type_two_per_type_one+1} type 2
             # so as to match the required total counts of each.
             type_two_per_type_one = (initial_size - num_type_one) / num_type_one
             # Number of type 1 + {type_two_per_bel+1} type 2 sequences needed
             num_extra_type_two = round(num_type_one * (type_two_per_type_one % 1.0))
-            series_fewer_type_two = pd.Series(
-                [label_type_one] + [label_type_two] * math.floor(type_two_per_type_one)
-            )
-            series_more_type_two = pd.Series(
-                [label_type_one] + [label_type_two] * math.ceil(type_two_per_type_one)
-            )
-            types = np.concatenate(
+            codes = np.concatenate(
                 (
-                    np.tile(series_more_type_two, num_extra_type_two),
-                    np.tile(series_fewer_type_two, num_type_one - num_extra_type_two),
-                ),
-                axis=None,
+                    np.tile(
+                        np.r_[idx_1, np.full(math.ceil(type_two_per_type_one), idx_2)],
+                        num_extra_type_two,
+                    ),
+                    np.tile(
+                        np.r_[idx_1, np.full(math.floor(type_two_per_type_one), idx_2)],
+                        num_type_one - num_extra_type_two,
+                    ),
+                )
             )
-        types = np.tile(types, num_nodes).tolist()
+        types = np.tile(np.asarray(loco_types)[codes], num_nodes)
     else:
         raise ValueError(
             f"""Locopool build method '{method}' invalid or not implemented."""
@@ -376,16 +358,18 @@ def build_locopool(
             "Locomotive_ID": pl.Series(engine_numbers, dtype=pl.UInt32),
             "Locomotive_Type": pl.Series(types, dtype=pl.Categorical),
             "Node": pl.Series(sorted_nodes, dtype=pl.Categorical),
-            "Arrival_Time": pl.Series(np.zeros(rows), dtype=pl.Float64),
-            "Servicing_Done_Time": pl.Series(np.zeros(rows), dtype=pl.Float64),
-            "Refueling_Done_Time": pl.Series(np.tile(0, rows), dtype=pl.Float64),
-            "Status": pl.Series(np.tile("Ready", rows), dtype=pl.Categorical),
-            "SOC_Target_J": pl.Series(np.zeros(rows), dtype=pl.Float64),
-            "Refuel_Duration": pl.Series(np.zeros(rows), dtype=pl.Float64),
-            "Refueler_J_Per_Hr": pl.Series(np.zeros(rows), dtype=pl.Float64),
-            "Refueler_Efficiency": pl.Series(np.zeros(rows), dtype=pl.Float64),
-            "Port_Count": pl.Series(np.zeros(rows), dtype=pl.UInt32),
         }
+    ).with_columns(
+        # initial state is constant across the pool, so broadcast literals
+        pl.lit(0.0).alias("Arrival_Time"),
+        pl.lit(0.0).alias("Servicing_Done_Time"),
+        pl.lit(0.0).alias("Refueling_Done_Time"),
+        pl.lit("Ready").cast(pl.Categorical).alias("Status"),
+        pl.lit(0.0).alias("SOC_Target_J"),
+        pl.lit(0.0).alias("Refuel_Duration"),
+        pl.lit(0.0).alias("Refueler_J_Per_Hr"),
+        pl.lit(0.0).alias("Refueler_Efficiency"),
+        pl.lit(0, dtype=pl.UInt32).alias("Port_Count"),
     )
 
     loco_info_pl = pl.from_pandas(
@@ -421,15 +405,10 @@ def build_refuelers(
     ports_per_node = (
         loco_pool.group_by(pl.col("Locomotive_Type", "Fuel_Type").cast(pl.Utf8))
         .agg(
-            [
-                (
-                    pl.lit(refuelers_per_incoming_corridor)
-                    * pl.len()
-                    / pl.lit(loco_pool.height)
-                )
-                .ceil()
-                .alias("Ports_Per_Node")
-            ]
+            (pl.len() * refuelers_per_incoming_corridor / loco_pool.height)
+            .ceil()
+            .cast(pl.UInt32)
+            .alias("Ports_Per_Node")
         )
         .join(
             pl.from_pandas(refueler_info),
@@ -438,83 +417,34 @@ def build_refuelers(
         )
     )
 
-    locations = pd.DataFrame(data={"Node": np.tile(node_list, ports_per_node.height)})
-    locations = locations.sort_values(by=["Node"]).reset_index(drop=True)
-
-    refuelers = pl.DataFrame(
-        {
-            "Node": pl.Series(locations["Node"], dtype=pl.Categorical).cast(
+    refuelers = (
+        pl.DataFrame({"Node": node_list})
+        .sort("Node")
+        .join(ports_per_node, how="cross")
+        .select(
+            pl.col("Node", "Refueler_Type", "Locomotive_Type", "Fuel_Type").cast(
                 pl.Categorical
             ),
-            "Refueler_Type": pl.Series(
-                np.tile(
-                    ports_per_node.get_column("Refueler_Type").to_list(), len(node_list)
-                ),
-                dtype=pl.Categorical,
-            ).cast(pl.Categorical),
-            "Locomotive_Type": pl.Series(
-                np.tile(
-                    ports_per_node.get_column("Locomotive_Type").to_list(),
-                    len(node_list),
-                ),
-                dtype=pl.Categorical,
-            ).cast(pl.Categorical),
-            "Fuel_Type": pl.Series(
-                np.tile(
-                    ports_per_node.get_column("Fuel_Type").to_list(), len(node_list)
-                ),
-                dtype=pl.Categorical,
-            ).cast(pl.Categorical),
-            "Refueler_J_Per_Hr": pl.Series(
-                np.tile(
-                    ports_per_node.get_column("Refueler_J_Per_Hr").to_list(),
-                    len(node_list),
-                ),
-                dtype=pl.Float64,
-            ),
-            "Refueler_Efficiency": pl.Series(
-                np.tile(
-                    ports_per_node.get_column("Refueler_Efficiency").to_list(),
-                    len(node_list),
-                ),
-                dtype=pl.Float64,
-            ),
-            "Lifespan_Years": pl.Series(
-                np.tile(
-                    ports_per_node.get_column("Lifespan_Years").to_list(),
-                    len(node_list),
-                ),
-                dtype=pl.Float64,
-            ),
-            "Cost_USD": pl.Series(
-                np.tile(
-                    ports_per_node.get_column("Cost_USD").to_list(), len(node_list)
-                ),
-                dtype=pl.Float64,
-            ),
-            "Port_Count": pl.Series(
-                np.tile(
-                    ports_per_node.get_column("Ports_Per_Node").to_list(),
-                    len(node_list),
-                ),
-                dtype=pl.UInt32,
-            ),
-        }
+            pl.col(
+                "Refueler_J_Per_Hr", "Refueler_Efficiency", "Lifespan_Years", "Cost_USD"
+            ).cast(pl.Float64),
+            pl.col("Ports_Per_Node").alias("Port_Count"),
+        )
     )
     return refuelers
 
 
 def append_charging_guidelines(
-    refuelers: pl.DataFrame,
-    loco_pool: pl.DataFrame,
-    demand: pl.DataFrame,
-    network_charging_guidelines: pl.DataFrame,
-) -> pl.DataFrame:
-    active_ods = demand.select(["Origin", "Destination"]).unique()
+    refuelers: Union[pl.DataFrame, pl.LazyFrame],
+    loco_pool: Union[pl.DataFrame, pl.LazyFrame],
+    demand: Union[pl.DataFrame, pl.LazyFrame],
+    network_charging_guidelines: Union[pl.DataFrame, pl.LazyFrame],
+) -> Tuple[pl.DataFrame, pl.DataFrame]:
+    active_ods = demand.lazy().select(["Origin", "Destination"])
     network_charging_guidelines = (
-        network_charging_guidelines.join(
-            active_ods, on=["Origin", "Destination"], how="inner"
-        )
+        network_charging_guidelines.lazy()
+        # semi join: filter to active (Origin, Destination) pairs without joining columns
+        .join(active_ods, on=["Origin", "Destination"], how="semi")
         .group_by(pl.col("Origin"))
         .agg(
             pl.col("Allowable_Battery_Headroom_MWh").min() * 1e6 / utilities.MWH_PER_MJ
@@ -522,35 +452,38 @@ def append_charging_guidelines(
         .rename({"Allowable_Battery_Headroom_MWh": "Battery_Headroom_J"})
         .with_columns(pl.col("Origin").cast(pl.Categorical))
     )
-    refuelers = refuelers.join(
-        network_charging_guidelines, left_on="Node", right_on="Origin", how="left"
-    ).with_columns(
+    battery_headroom_j = (
         pl.when(pl.col("Fuel_Type") == "Electricity")
         .then(pl.col("Battery_Headroom_J"))
         .otherwise(0)
         .fill_null(0)
         .alias("Battery_Headroom_J")
     )
-    loco_pool = (
-        loco_pool.join(
+    refuelers = (
+        refuelers.lazy()
+        .join(
             network_charging_guidelines, left_on="Node", right_on="Origin", how="left"
         )
-        .with_columns(
-            pl.when(pl.col("Fuel_Type") == "Electricity")
-            .then(pl.col("Battery_Headroom_J"))
-            .otherwise(0)
-            .fill_null(0)
-            .alias("Battery_Headroom_J")
+        .with_columns(battery_headroom_j)
+    )
+    loco_pool = (
+        loco_pool.lazy()
+        .join(
+            network_charging_guidelines, left_on="Node", right_on="Origin", how="left"
         )
         .with_columns(
+            battery_headroom_j,
             pl.max_horizontal(
                 [
-                    pl.col("SOC_Max_J") - pl.col("Battery_Headroom_J"),
+                    pl.col("SOC_Max_J") - battery_headroom_j,
                     pl.col("SOC_Min_J"),
                 ]
-            ).alias("SOC_J")
+            ).alias("SOC_J"),
         )
     )
+    # collecting both plans together lets polars evaluate the shared guideline
+    # aggregation once
+    refuelers, loco_pool = pl.collect_all([refuelers, loco_pool])
     return refuelers, loco_pool
 
 
@@ -645,8 +578,20 @@ def appendTonsAndHP(
         .drop(["KG_Empty", "KG"])
     )
 
-    return (
-        df.with_columns(
+    # join on a materialized base train type rather than on key expressions, which
+    # polars' lazy optimizer can mis-push predicates through
+    train_type_base = (
+        pl.col("Train_Type")
+        .str.strip_suffix("_Empty")
+        .str.strip_suffix("_Loaded")
+        .alias("Train_Type_Base")
+    )
+    hp_per_ton = hp_per_ton.lazy().with_columns(train_type_base).drop("Train_Type")
+
+    # joins run lazily so LazyFrame inputs stay lazy; eager inputs are collected below
+    tons_and_hp = (
+        df.lazy()
+        .with_columns(
             pl.when(pl.col("Train_Type").str.contains(pl.lit("_Empty")))
             .then(pl.col("Train_Type"))
             .otherwise(
@@ -657,17 +602,12 @@ def appendTonsAndHP(
             .replace_strict(freight_type_to_car_type)
             .alias("Car_Type")
         )
-        .join(tons_per_car, how="left", on="Car_Type")
+        .join(tons_per_car.lazy(), how="left", on="Car_Type")
+        .with_columns(train_type_base)
         # Merge on OD-specific hp_per_ton if the user specified any
         .join(
             hp_per_ton.filter(pl.col("O_D") != pl.lit("Default")).drop("O_D"),
-            on=[
-                pl.col("Origin"),
-                pl.col("Destination"),
-                pl.col("Train_Type")
-                .str.strip_suffix("_Empty")
-                .str.strip_suffix("_Loaded"),
-            ],
+            on=["Origin", "Destination", "Train_Type_Base"],
             how="left",
         )
         # Second, merge on defaults per train type
@@ -675,11 +615,7 @@ def appendTonsAndHP(
             hp_per_ton.filter((pl.col("O_D") == "Default")).drop(
                 ["O_D", "Origin", "Destination"]
             ),
-            on=[
-                pl.col("Train_Type")
-                .str.strip_suffix("_Empty")
-                .str.strip_suffix("_Loaded")
-            ],
+            on="Train_Type_Base",
             how="left",
             suffix="_Default",
         )
@@ -688,5 +624,12 @@ def appendTonsAndHP(
                 "HP_Required_Per_Ton"
             )
         )
-        .drop(cs.ends_with("_Default") | cs.ends_with("_right"))
+        .drop(
+            cs.ends_with("_Default")
+            | cs.ends_with("_right")
+            | cs.by_name("Train_Type_Base")
+        )
     )
+    if isinstance(df, pl.LazyFrame):
+        return tons_and_hp
+    return tons_and_hp.collect()
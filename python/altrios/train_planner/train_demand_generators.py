@@ -1,7 +1,6 @@
 from typing import Union, List, Dict, Callable
 import polars as pl
 import polars.selectors as cs
-import pandas as pd
 import numpy as np
 import altrios as alt
 from altrios.train_planner import planner_config, data_prep
@@ -26,7 +25,7 @@ def initialize_reverse_empties(demand: Union[pl.LazyFrame, pl.DataFrame]) -> Uni
     """
     return (demand
         .rename({"Origin": "Destination", "Destination": "Origin"})
-        .with_columns((pl.concat_str(pl.col("Train_Type"),pl.lit("_Empty"))).alias("Train_Type"))
+        .with_columns((pl.col("Train_Type") + pl.lit("_Empty")).alias("Train_Type"))
     )    
 
 def generate_return_demand_unit(demand_subset: Union[pl.LazyFrame, pl.DataFrame], config: planner_config.TrainPlannerConfig) -> Union[pl.LazyFrame, pl.DataFrame]:
@@ -71,6 +70,7 @@ def generate_return_demand_intermodal(demand_subset: Union[pl.LazyFrame, pl.Data
     ----------
     Updated demand `DataFrame` or `LazyFrame` representing demand in the reverse direction(s) for each origin-destination pair.
     """
+    count_cols = [col for col in demand_subset.collect_schema() if col.startswith("Number_of")]
     demand_subset = (demand_subset
         .pipe(initialize_reverse_empties)
         .with_columns(
@@ -79,8 +79,9 @@ def generate_return_demand_intermodal(demand_subset: Union[pl.LazyFrame, pl.Data
         .with_columns(
             pl.selectors.starts_with("Number_of").range().over("OD").name.suffix("_Return")
         )
-        .sort([pl.col("OD"), pl.selectors.starts_with("Number_of")], descending=True)
-        .group_by("OD").first() # Max demand direction per corridor
+        # Max demand direction per corridor, picked within each group rather than by sorting the whole frame
+        .group_by("OD")
+            .agg(pl.all().sort_by(count_cols + [f"{col}_Return" for col in count_cols], descending=True).first())
         .drop([
             pl.col("OD"), 
             (pl.selectors.starts_with("Number_of") & ~(pl.selectors.ends_with("_Return")))
@@ -106,8 +107,26 @@ def generate_return_demand(
     df_return_demand: The demand generated by the need
     of returning the empty cars to their original nodes
     """
-    demand_subsets = demand.partition_by("Train_Type", as_dict = True)
-    return_demands = []
+    # Unit and Manifest returns differ only by a per-row scaling, so train types still
+    # bound to those built-in generators are reversed together in a single pass
+    default_generators = get_default_return_demand_generators()
+    vectorized_train_types = [train_type for train_type in ("Unit", "Manifest")
+        if config.return_demand_generators.get(train_type) is default_generators[train_type]]
+    return_demands = [demand
+        .filter(pl.col("Train_Type").is_in(vectorized_train_types))
+        .pipe(initialize_reverse_empties)
+        .with_columns(
+            pl.when(pl.col("Train_Type") == pl.lit("Manifest_Empty"))
+                .then((pl.col("Number_of_Cars") * config.manifest_empty_return_ratio).floor().cast(pl.UInt32))
+                .otherwise(pl.col("Number_of_Cars"))
+                .alias("Number_of_Cars"))
+    ]
+    # presorting keeps each train type contiguous for partitioning
+    demand_subsets = (demand
+        .filter(~pl.col("Train_Type").is_in(vectorized_train_types))
+        .sort("Train_Type")
+        .partition_by("Train_Type", as_dict = True, maintain_order = True)
+    )
     for train_type, demand_subset in demand_subsets.items():
         train_type_label = train_type[0]
         if train_type_label in config.return_demand_generators:
@@ -117,7 +136,9 @@ def generate_return_demand(
         else:
             print(f'Return demand generator not implemented for train type: {train_type_label}')
 
-    demand_return = (pl.concat(return_demands, how="diagonal_relaxed")
+    # generators may return different column sets, so more than one needs schema alignment
+    demand_return = (return_demands[0] if len(return_demands) == 1 else pl.concat(return_demands, how="diagonal_relaxed"))
+    demand_return = (demand_return
         .filter(pl.sum_horizontal(pl.selectors.starts_with("Number_of")) > 0)
     )
     return demand_return
@@ -161,45 +182,41 @@ def generate_manifest_rebalancing_demand(
         df_balance_storage: Documented additional manifest demand pairs and corresponding quantity for
         rebalancing process
         """
-        df_balance_storage = pd.DataFrame(np.zeros(shape=(0, 4)))
-        df_balance_storage = df_balance_storage.rename(
-            columns={0: "Origin", 
-                    1: "Destination", 
-                    2: "Train_Type", 
-                    3: "Number_of_Cars"})
-        
         train_type = "Manifest_Empty"
-        demand = demand_origin_manifest.to_pandas()[
-            ["Origin","Manifest_Received","Manifest_Dispatched","Manifest_Empty"]]
-        demand = demand.rename(columns={"Manifest_Received": "Received", 
-                                "Manifest_Dispatched": "Dispatched",
-                                "Manifest_Empty": "Empty"})
+        origins = demand_origin_manifest.get_column("Origin").to_numpy()
+        received = demand_origin_manifest.get_column("Manifest_Received").cast(pl.Float64).to_numpy(writable=True)
+        dispatched = demand_origin_manifest.get_column("Manifest_Dispatched").cast(pl.Float64).to_numpy(writable=True)
+        idx_sur_storage = []
+        idx_def_storage = []
+        surplus_storage = []
 
         step = 0
         # Calculate the number of iterations needed
-        max_iter = len(demand) * (len(demand)-1) / 2
-        while (~np.isclose(demand["Received"], demand["Dispatched"])).any() and (step <= max_iter):
-            rows_def = demand[demand["Received"] < demand["Dispatched"]]
-            rows_sur = demand[demand["Received"] > demand["Dispatched"]]
-            if((len(rows_def) == 0) | (len(rows_sur) == 0)): 
+        max_iter = len(origins) * (len(origins)-1) / 2
+        while (~np.isclose(received, dispatched)).any() and (step <= max_iter):
+            is_def = received < dispatched
+            is_sur = received > dispatched
+            if (not is_def.any()) | (not is_sur.any()):
                 break
             # Find the first node that is in deficit of cars because of the empty return
-            row_def = rows_def.index[0]
+            row_def = np.argmax(is_def)
             # Find the first node that is in surplus of cars
-            row_sur = rows_sur.index[0]
-            surplus = demand.loc[row_sur, "Received"] - demand.loc[row_sur, "Dispatched"]
-            df_balance_storage.loc[len(df_balance_storage.index)] = \
-                [demand.loc[row_sur, "Origin"],
-                demand.loc[row_def, "Origin"],
-                train_type,
-                surplus]
-            demand.loc[row_def, "Received"] += surplus
-            demand.loc[row_sur, "Dispatched"] = demand.loc[row_sur, "Received"]
+            row_sur = np.argmax(is_sur)
+            surplus = received[row_sur] - dispatched[row_sur]
+            idx_sur_storage.append(row_sur)
+            idx_def_storage.append(row_def)
+            surplus_storage.append(surplus)
+            received[row_def] += surplus
+            dispatched[row_sur] = received[row_sur]
             step += 1
-            
-        if (~np.isclose(demand["Received"], demand["Dispatched"])).any():
+
+        if (~np.isclose(received, dispatched)).any():
             raise Exception("While loop didn't converge")
-        return pl.from_pandas(df_balance_storage)
+        return pl.DataFrame({
+            "Origin": pl.Series(origins[idx_sur_storage], dtype=pl.Utf8),
+            "Destination": pl.Series(origins[idx_def_storage], dtype=pl.Utf8),
+            "Train_Type": pl.Series([train_type] * len(surplus_storage), dtype=pl.Utf8),
+            "Number_of_Cars": pl.Series(surplus_storage, dtype=pl.Float64)})
 
     manifest_demand = (demand
         .filter(pl.col("Train_Type").str.strip_suffix("_Loaded") == "Manifest")
@@ -250,84 +267,55 @@ def generate_demand_trains(
     ----------
     demand: Tabulated demand for each demand pair in terms of number of cars and number of trains
     """
-    cars_per_train_min = (pl.from_dict(config.min_cars_per_train)
-        .melt(variable_name="Train_Type", value_name="Cars_Per_Train_Min")
-    )
-    cars_per_train_min_default = (cars_per_train_min
-        .filter(pl.col("Train_Type") == pl.lit("Default"))
-        .select("Cars_Per_Train_Min").item()
-    )
-    cars_per_train_target = (pl.from_dict(config.target_cars_per_train)
-        .melt(variable_name="Train_Type", value_name="Cars_Per_Train_Target")
-    )
-    cars_per_train_target_default = (cars_per_train_target
-        .filter(pl.col("Train_Type") == pl.lit("Default"))
-        .select("Cars_Per_Train_Target").item()
-    )
-             
-    demand = (pl.concat([demand, demand_returns, demand_rebalancing], how="diagonal_relaxed")
+    # build the whole table as one lazy plan, collected once at the end
+    demand = (pl.concat([demand.lazy(), demand_returns.lazy(), demand_rebalancing.lazy()], how="diagonal_relaxed")
         .group_by("Origin","Destination", "Train_Type")
             .agg(pl.col("Number_of_Cars").sum())
         .filter(pl.col("Number_of_Cars") > 0)
         .pipe(data_prep.appendTonsAndHP, rail_vehicles, freight_type_to_car_type, config)
-        # Merge on cars_per_train_min if the user specified any
-        .join(cars_per_train_min,  
-              left_on = pl.when(pl.col("Train_Type").str.contains(pl.lit("_Empty")))
-                    .then(pl.col("Train_Type"))
-                    .otherwise(pl.concat_str(pl.col("Train_Type").str.strip_suffix("_Loaded"), pl.lit("_Loaded"))),
-              right_on=["Train_Type"], 
-              how="left")
-        .drop(cs.ends_with("_right"))
-        # Merge on cars_per_train_target if the user specified any
-        .join(cars_per_train_target, 
-              left_on = pl.when(pl.col("Train_Type").str.contains(pl.lit("_Empty")))
-                    .then(pl.col("Train_Type"))
-                    .otherwise(pl.concat_str(pl.col("Train_Type").str.strip_suffix("_Loaded"), pl.lit("_Loaded"))),
-              right_on=["Train_Type"], 
-              how="left")
-        .drop(cs.ends_with("_right"))
-        # Fill in defaults per train type wherever the user didn't specify OD-specific hp_per_ton
+        # Scan the train type strings once; downstream steps reuse these columns
         .with_columns(
-            pl.col("Cars_Per_Train_Min").fill_null(cars_per_train_min_default),
-            pl.col("Cars_Per_Train_Target").fill_null(cars_per_train_target_default),
-        )
-    )
-    loaded = (demand
-        .filter(~pl.col("Train_Type").str.contains("_Empty"))
+            pl.col("Train_Type").str.contains("_Empty", literal=True).alias("Is_Empty"),
+            pl.col("Train_Type").str.strip_suffix("_Empty").alias("Train_Type_Base"))
+        # Look up cars_per_train_min and cars_per_train_target for each train type,
+        # falling back to the defaults wherever the user didn't specify one
         .with_columns(
-            pl.col("Number_of_Cars", "Tons_Per_Car", "HP_Required_Per_Ton", "Cars_Per_Train_Min", "Cars_Per_Train_Target").name.suffix("_Loaded")
-        )
-    )
-    empty = (demand
-        .filter(pl.col("Train_Type").str.contains("_Empty"))
+            pl.when(pl.col("Is_Empty"))
+                .then(pl.col("Train_Type"))
+                .otherwise(pl.concat_str(pl.col("Train_Type").str.strip_suffix("_Loaded"), pl.lit("_Loaded")))
+                .alias("Cars_Per_Train_Key"))
         .with_columns(
-            pl.col("Number_of_Cars", "Tons_Per_Car", "HP_Required_Per_Ton", "Cars_Per_Train_Min", "Cars_Per_Train_Target").name.suffix("_Empty"),
-            pl.col("Train_Type").str.strip_suffix("_Empty")
+            pl.col("Cars_Per_Train_Key")
+                .replace_strict(config.min_cars_per_train, default=config.min_cars_per_train["Default"])
+                .alias("Cars_Per_Train_Min"),
+            pl.col("Cars_Per_Train_Key")
+                .replace_strict(config.target_cars_per_train, default=config.target_cars_per_train["Default"])
+                .alias("Cars_Per_Train_Target"),
         )
+        .drop("Cars_Per_Train_Key")
     )
+    is_empty = pl.col("Is_Empty")
+    # Loaded and empty demand for the same base train type collapse into one row,
+    # aggregated conditionally in a single pass over the grouped demand
     demand = (demand
-        .select(pl.col("Origin", "Destination"), pl.col("Train_Type").str.strip_suffix("_Empty"))
-        .unique()
-        .join(loaded.select(cs.by_name("Origin", "Destination", "Train_Type") | cs.ends_with("_Loaded")), on=["Origin", "Destination", "Train_Type"], how="left")
-        .join(empty.select(cs.by_name("Origin", "Destination", "Train_Type") | cs.ends_with("_Empty")), on=["Origin", "Destination", "Train_Type"], how="left")
-        # Replace nulls with zero
-        .with_columns(cs.float().fill_null(0.0), 
-                      cs.by_dtype(pl.UInt32).fill_null(pl.lit(0).cast(pl.UInt32)),
-                      cs.by_dtype(pl.Int64).fill_null(pl.lit(0).cast(pl.Int64)),
-                      )
-        .group_by("Origin", "Destination", "Train_Type")
+        .group_by("Origin", "Destination", pl.col("Train_Type_Base").alias("Train_Type"))
             .agg(
-                pl.col("Number_of_Cars_Loaded", "Number_of_Cars_Empty").sum(),
-                pl.col("Tons_Per_Car_Loaded", "Tons_Per_Car_Empty", 
-                       "HP_Required_Per_Ton_Loaded", "HP_Required_Per_Ton_Empty",
-                       "Cars_Per_Train_Min_Loaded", "Cars_Per_Train_Min_Empty",
-                       "Cars_Per_Train_Target_Loaded", "Cars_Per_Train_Target_Empty").mean(),
-                pl.sum_horizontal("Number_of_Cars_Loaded", "Number_of_Cars_Empty").sum().alias("Number_of_Cars")
+                pl.col("Number_of_Cars").filter(~is_empty).sum().alias("Number_of_Cars_Loaded"),
+                pl.col("Number_of_Cars").filter(is_empty).sum().alias("Number_of_Cars_Empty"),
+                pl.col("Tons_Per_Car").filter(~is_empty).mean().alias("Tons_Per_Car_Loaded"),
+                pl.col("Tons_Per_Car").filter(is_empty).mean().alias("Tons_Per_Car_Empty"),
+                pl.col("HP_Required_Per_Ton").filter(~is_empty).mean().alias("HP_Required_Per_Ton_Loaded"),
+                pl.col("HP_Required_Per_Ton").filter(is_empty).mean().alias("HP_Required_Per_Ton_Empty"),
+                pl.col("Cars_Per_Train_Min", "Cars_Per_Train_Target").mul("Number_of_Cars").sum()
             )
-        .with_columns(
+        # Replace nulls (no loaded or no empty demand for this train type) with zero
+        .with_columns(cs.float().fill_null(0.0))
+        .with_columns((pl.col("Number_of_Cars_Loaded") + pl.col("Number_of_Cars_Empty")).alias("Number_of_Cars"))
+        # Selected rather than updated in place so that `Number_of_Cars` precedes them, as in the output columns
+        .select(
+            pl.exclude("Cars_Per_Train_Min", "Cars_Per_Train_Target"),
             # If Cars_Per_Train_Min and Cars_Per_Train_Target "disagree" for empty vs. loaded, take the average weighted by number of cars
-            ((pl.col("Cars_Per_Train_Min_Loaded").mul("Number_of_Cars_Loaded") + pl.col("Cars_Per_Train_Min_Empty").mul("Number_of_Cars_Empty")) / pl.col("Number_of_Cars")).alias("Cars_Per_Train_Min"),
-            ((pl.col("Cars_Per_Train_Target_Loaded").mul("Number_of_Cars_Loaded") + pl.col("Cars_Per_Train_Target_Empty").mul("Number_of_Cars_Empty")) / pl.col("Number_of_Cars")).alias("Cars_Per_Train_Target")
+            pl.col("Cars_Per_Train_Min", "Cars_Per_Train_Target").truediv("Number_of_Cars")
         )
         .with_columns(
             pl.when(config.single_train_mode)
@@ -351,6 +339,6 @@ def generate_demand_trains(
             pl.col("Number_of_Cars_Empty").mul(config.containers_per_car).alias("Number_of_Containers_Empty"),
             pl.lit(config.simulation_days).alias("Number_of_Days")
         )
-        .drop("Cars_Per_Train_Target_Loaded", "Cars_Per_Train_Target_Empty", "Cars_Per_Train_Min_Empty", "Cars_Per_Train_Min_Loaded")
+        .collect(streaming=True)
     )
     return demand
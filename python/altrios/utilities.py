@@ -10,6 +10,7 @@ import numpy.typing as npt
 from pathlib import Path
 import os
 import shutil
+from functools import lru_cache
 
 # local imports
 from altrios import __version__
@@ -31,6 +32,7 @@ MWH_PER_J = 2.77778e-10
 MWH_PER_MJ = KWH_PER_MJ / 1.0e3
 
 
+@lru_cache(maxsize=1)
 def package_root() -> Path:
     """
     Returns the package root directory.
@@ -39,6 +41,7 @@ def package_root() -> Path:
     return path
 
 
+@lru_cache(maxsize=1)
 def resources_root() -> Path:
     """
     Returns the resources root directory.
@@ -60,10 +63,10 @@ def cumutrapz(x, y):
     y: array of values being integrated
     """
     assert len(x) == len(y)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
     z = np.zeros(len(x))
-    z[0] = 0
-    for i in np.arange(1, len(x)):
-        z[i] = z[i - 1] + 0.5 * (y[i] + y[i - 1]) * (x[i] - x[i - 1])
+    np.cumsum(0.5 * (y[1:] + y[:-1]) * np.diff(x), out=z[1:])
     return z
 
 
@@ -75,10 +78,19 @@ pl.Expr.range = range_minmax  # type: ignore[attr-defined]
 del range_minmax
 
 
-def cumPctWithinGroup(
-    df: Union[pl.DataFrame, pl.LazyFrame], grouping_vars: List[str]
+def _collect_like(
+    df: Union[pl.DataFrame, pl.LazyFrame], lf: pl.LazyFrame
 ) -> Union[pl.DataFrame, pl.LazyFrame]:
-    return df.with_columns(
+    """
+    Returns `lf` as-is if `df` is lazy, otherwise collects it.
+    """
+    if isinstance(df, pl.LazyFrame):
+        return lf
+    return lf.collect()
+
+
+def _cumPctWithinGroup(lf: pl.LazyFrame, grouping_vars: List[str]) -> pl.LazyFrame:
+    return lf.with_columns(
         (
             (pl.int_range(pl.len(), dtype=pl.UInt32).over(grouping_vars).add(1))
             / pl.count().over(grouping_vars)
@@ -86,12 +98,20 @@ def cumPctWithinGroup(
     )
 
 
-def allocateIntegerEvenly(
-    df: Union[pl.DataFrame, pl.LazyFrame], target: str, grouping_vars: List[str]
+def cumPctWithinGroup(
+    df: Union[pl.DataFrame, pl.LazyFrame], grouping_vars: List[str]
 ) -> Union[pl.DataFrame, pl.LazyFrame]:
+    return _collect_like(df, _cumPctWithinGroup(df.lazy(), grouping_vars))
+
+
+def _allocateIntegerEvenly(
+    lf: pl.LazyFrame, target: str, grouping_vars: List[str]
+) -> pl.LazyFrame:
     return (
-        df.sort(grouping_vars)
-        .pipe(cumPctWithinGroup, grouping_vars=grouping_vars)
+        lf.sort(grouping_vars)
+        # the leading grouping column is sorted, so windows over it see contiguous runs
+        .with_columns(pl.col(grouping_vars[0]).set_sorted())
+        .pipe(_cumPctWithinGroup, grouping_vars=grouping_vars)
         .with_columns(
             pl.col(target)
             .mul("Percent_Within_Group_Cumulative")
@@ -110,11 +130,18 @@ def allocateIntegerEvenly(
     )
 
 
-def allocateItems(
-    df: Union[pl.DataFrame, pl.LazyFrame], grouping_vars: list[str], count_target: str
+def allocateIntegerEvenly(
+    df: Union[pl.DataFrame, pl.LazyFrame], target: str, grouping_vars: List[str]
 ) -> Union[pl.DataFrame, pl.LazyFrame]:
+    return _collect_like(df, _allocateIntegerEvenly(df.lazy(), target, grouping_vars))
+
+
+def _allocateItems(
+    lf: pl.LazyFrame, grouping_vars: list[str], count_target: str
+) -> pl.LazyFrame:
     return (
-        df.sort(grouping_vars + [count_target], descending=True)
+        lf.sort(grouping_vars + [count_target], descending=True)
+        .with_columns(pl.col(grouping_vars[0]).set_sorted(descending=True))
         .with_columns(
             pl.col(count_target)
             .sum()
@@ -144,6 +171,26 @@ def allocateItems(
     )
 
 
+def allocateItems(
+    df: Union[pl.DataFrame, pl.LazyFrame], grouping_vars: list[str], count_target: str
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    return _collect_like(df, _allocateItems(df.lazy(), grouping_vars, count_target))
+
+
+def _interp_columns(x: np.ndarray, xp: np.ndarray, fp: np.ndarray) -> np.ndarray:
+    """
+    Linearly interpolates each column of 2D `fp` at `x`, with the same clamping at
+    the ends as `np.interp`.  Bracketing indices and weights are computed once and
+    shared by all columns.
+    """
+    if len(xp) < 2:
+        return np.repeat(fp[:1], len(x), axis=0)
+    idx = np.clip(np.searchsorted(xp, x, side="right") - 1, 0, len(xp) - 2)
+    dx = xp[idx + 1] - xp[idx]
+    w = np.clip(np.divide(x - xp[idx], dx, out=np.ones_like(x), where=dx > 0), 0.0, 1.0)
+    return fp[idx] + w[:, None] * (fp[idx + 1] - fp[idx])
+
+
 def resample(
     df: pd.DataFrame,
     dt_new: Optional[float] = 1.0,
@@ -162,52 +209,51 @@ def resample(
         (e.g. quantized variables like current gear)
     """
 
-    new_dict = dict()
+    xp = df[time_col].to_numpy(dtype=np.float64)
+    new_time = np.arange(0, np.floor(xp[-1] / dt_new) * dt_new + dt_new, dt_new)
 
-    new_time = np.arange(
-        0, np.floor(df[time_col].to_numpy()[-1] / dt_new) * dt_new + dt_new, dt_new
-    )
+    # hold vars are not yet handled and are left out of the result
+    rate_cols = [col for col in df.columns if col in rate_vars]
+    state_cols = [
+        col for col in df.columns if col not in rate_vars and col not in hold_vars
+    ]
 
-    for col in df.columns:
-        if col in rate_vars:
-            # calculate average value over time step
-            cumu_vals = (df[time_col].diff().fillna(0) * df[col]).cum_sum()
-            new_dict[col] = (
-                np.diff(
-                    np.interp(x=new_time, xp=df[time_col].to_numpy(), fp=cumu_vals),
-                    prepend=0,
-                )
-                / dt_new
-            )
+    new_dict = dict()
 
-        elif col in hold_vars:
-            assert col not in rate_vars
-            pass  # this may need to be fleshed out
+    # just interpolate -- i.e. state variables like temperatures
+    new_state = _interp_columns(new_time, xp, df[state_cols].to_numpy(dtype=np.float64))
+    new_dict.update(zip(state_cols, new_state.T))
 
-        else:
-            # just interpolate -- i.e. state variables like temperatures
-            new_dict[col] = np.interp(
-                x=new_time, xp=df[time_col].to_numpy(), fp=df[col].to_numpy()
-            )
+    if len(rate_cols) > 0:
+        # calculate average value over time step
+        cumu_vals = np.cumsum(
+            np.diff(xp, prepend=xp[0])[:, None]
+            * df[rate_cols].to_numpy(dtype=np.float64),
+            axis=0,
+        )
+        new_rate = (
+            np.diff(_interp_columns(new_time, xp, cumu_vals), axis=0, prepend=0)
+            / dt_new
+        )
+        new_dict.update(zip(rate_cols, new_rate.T))
 
-    return pd.DataFrame(new_dict)
+    return pd.DataFrame({col: new_dict[col] for col in df.columns if col in new_dict})
 
 
 def smoothen(signal: npt.ArrayLike, period: int = 9) -> npt.ArrayLike:
     """
     Apply smoothing to signal, assuming 1 Hz data collection.
     """
-    new_signal = np.convolve(
-        np.concatenate(
-            [
-                np.full(((period + 1) // 2) - 1, signal[0]),
-                signal,
-                np.full(period // 2, signal[-1]),
-            ]
-        ),
-        np.ones(period) / period,
-        mode="valid",
+    padded = np.concatenate(
+        [
+            np.full(((period + 1) // 2) - 1, signal[0]),
+            signal,
+            np.full(period // 2, signal[-1]),
+        ]
     )
+    # moving average via a running sum, O(N) regardless of window length
+    csum = np.concatenate(([0.0], np.cumsum(padded, dtype=np.float64)))
+    new_signal = (csum[period:] - csum[:-period]) / period
     return new_signal
 
 
@@ -235,15 +281,12 @@ def copy_demo_files(demo_path: Path = Path("demos")):
             continue
         src_file: Path
         dest_file = demo_path / src_file.name
-        shutil.copyfile(src_file, dest_file)
-
-        with open(dest_file, "r+") as file:
-            file_content = file.readlines()
-            prepend_str = f"# %% Copied from ALTRIOS version '{v}'. Guaranteed compatibility with this version only.\n"
-            prepend = [prepend_str]
-            file_content = prepend + file_content
-            file.seek(0)
-            file.writelines(file_content)
+        prepend_str = f"# %% Copied from ALTRIOS version '{v}'. Guaranteed compatibility with this version only.\n"
+
+        # write the header, then stream the demo after it in a single pass
+        with open(src_file, "rb") as src, open(dest_file, "wb") as dst:
+            dst.write(prepend_str.encode())
+            shutil.copyfileobj(src, dst, length=64 * 1024)
 
     print(f"Saved {dest_file.name} to {dest_file}")
 